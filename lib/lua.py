@@ -9,12 +9,88 @@ This module contains all Lua-related functionality including:
 - Wrapping/unwrapping utilities
 """
 
+import functools
+import operator
+import re
 from typing import Any, Dict, Optional
 import lupa
 
 # Default for Lua safety mode
 SAFE_MODE_DEFAULT = True
 
+# Lua keywords that are never injected as globals (see evaluate_expression);
+# expressions consisting solely of these can't be treated as field lookups.
+# The value keywords nil/true/false matter for _evaluate_trivial: Lua resolves
+# them to their constants even when the item has a key of the same name.
+_LUA_KEYWORDS = frozenset(
+    ["and", "or", "not", "if", "then", "else", "end", "nil", "true", "false"]
+)
+
+# Sentinel returned by _evaluate_trivial when the expression is not trivial
+# and must go through the full Lua evaluation path.
+_NOT_TRIVIAL = object()
+
+# Simple field access ("score") or single numeric comparison ("age > 27").
+_TRIVIAL_FIELD_RE = re.compile(r"[A-Za-z_]\w*")
+_TRIVIAL_COMPARE_RE = re.compile(
+    r"([A-Za-z_]\w*)\s*(==|~=|<=?|>=?)\s*(-?\d+(?:\.\d+)?)"
+)
+_COMPARE_OPS = {
+    "==": operator.eq,
+    "~=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _evaluate_trivial(expression: str, item: Any, context: Optional[Dict]) -> Any:
+    """
+    Fast Python-side evaluation for trivial expressions, bypassing Lua entirely.
+
+    Handles the two most common expression shapes: a bare field access
+    ("score", "age") and a single numeric comparison ("age > 27"). Name
+    resolution matches evaluate_expression: context variables take precedence
+    over dict keys of the item. Returns _NOT_TRIVIAL when the expression (or
+    the resolved value) needs the full Lua runtime.
+    """
+    expr = expression.strip()
+
+    if _TRIVIAL_FIELD_RE.fullmatch(expr):
+        if expr in _LUA_KEYWORDS:
+            return _NOT_TRIVIAL
+        if context is not None and expr in context:
+            value = context[expr]
+        elif isinstance(item, dict) and expr in item:
+            value = item[expr]
+        else:
+            return _NOT_TRIVIAL
+        # Containers don't round-trip Lua unchanged (empty lists come back as
+        # {} at any depth), so only scalars may skip the Lua path.
+        if isinstance(value, (list, dict)):
+            return _NOT_TRIVIAL
+        return value
+
+    match = _TRIVIAL_COMPARE_RE.fullmatch(expr)
+    if match:
+        name, op, literal = match.groups()
+        if name in _LUA_KEYWORDS:
+            return _NOT_TRIVIAL
+        if context is not None and name in context:
+            value = context[name]
+        elif isinstance(item, dict) and name in item:
+            value = item[name]
+        else:
+            return _NOT_TRIVIAL
+        # Only plain numbers compare the same way in Python and Lua.
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return _NOT_TRIVIAL
+        number = float(literal) if "." in literal else int(literal)
+        return _COMPARE_OPS[op](value, number)
+
+    return _NOT_TRIVIAL
+
 
 def _unwrap_input(value: Any) -> Any:
     """
@@ -738,6 +814,77 @@ def create_lua_runtime(
     return lua_runtime
 
 
+# Cached expression runtimes keyed by safety mode (True/False). Building a
+# runtime applies the sandbox and registers every MCP tool wrapper, which is
+# far too expensive to repeat for each expression evaluation.
+_expression_runtimes: Dict[bool, tuple] = {}
+
+
+def _get_expression_runtime(safe_mode: Optional[bool]) -> tuple:
+    """
+    Return (runtime, make_env, lua_load, null_sentinel) for the given safety
+    mode, creating and caching the runtime on first use. Each evaluation gets
+    a fresh environment table from make_env whose lookups fall back to the
+    cached runtime's globals, so assignments made by one expression never
+    leak into the next.
+    """
+    if safe_mode is None:
+        safe_mode = SAFE_MODE_DEFAULT
+    cached = _expression_runtimes.get(safe_mode)
+    if cached is None:
+        runtime = create_lua_runtime(safe_mode)
+        cached = (
+            runtime,
+            runtime.eval("function() return setmetatable({}, {__index = _G}) end"),
+            runtime.eval("load"),
+            runtime.eval("null"),
+        )
+        _expression_runtimes[safe_mode] = cached
+    return cached
+
+
+def _make_expression_env(lua_runtime, make_env, item: Any, context: Optional[Dict]):
+    """
+    Build the per-evaluation environment table: dict keys of the item are
+    directly accessible, with context variables taking precedence.
+    """
+    env = make_env()
+    if isinstance(item, dict):
+        for key, value in item.items():
+            if isinstance(key, str) and key.isidentifier() and key not in _LUA_KEYWORDS:
+                env[key] = python_to_lua(value, lua_runtime)
+    if context is not None:
+        for k, v in context.items():
+            env[k] = python_to_lua(v, lua_runtime)
+    return env
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_expression(lua_load, expression: str):
+    """
+    Compile an expression into a Lua function that takes its environment
+    table as the _ENV parameter. Compiling (parse plus bytecode generation)
+    is the expensive half of an evaluation and depends only on the source
+    string, so the compiled function is cached and reused across calls with
+    different environments. Tries expression form first ("return (...)"),
+    then a statement block; raises lupa.LuaError if neither compiles.
+    """
+    load_error = None
+    for source in (
+        "return function(_ENV) return (" + expression + ") end",
+        "return function(_ENV) " + expression + " end",
+    ):
+        loaded = lua_load(source, "expression", "t")
+        if isinstance(loaded, tuple):
+            chunk = loaded[0]
+            load_error = loaded[1] if len(loaded) > 1 else None
+        else:
+            chunk = loaded
+        if chunk is not None:
+            return chunk()
+    raise lupa.LuaError(str(load_error))
+
+
 def python_to_lua(obj, lua_runtime):
     """
     Convert Python data structures to Lua equivalents. Handles None values,
@@ -1138,33 +1285,16 @@ def evaluate_expression_preserve_wrapped(
     This version preserves list({})/dict({}) wrapped objects instead of unwrapping them.
     """
     try:
-        lua_runtime = create_lua_runtime(safe_mode)
-        # Set up context - always make dict keys available for direct access
-        if isinstance(item, dict):
-            for key, value in item.items():
-                if (
-                    isinstance(key, str)
-                    and key.isidentifier()
-                    and key not in ["and", "or", "not", "if", "then", "else", "end"]
-                ):
-                    lua_runtime.globals()[key] = python_to_lua(
-                        value, lua_runtime
-                    )  # type: ignore  # noqa
-
-        # Set up additional context variables (may override dict keys)
-        if context is not None:
-            for k, v in context.items():
-                lua_runtime.globals()[k] = python_to_lua(
-                    v, lua_runtime
-                )  # type: ignore  # noqa
+        lua_runtime, make_env, lua_load, null_sentinel = _get_expression_runtime(
+            safe_mode
+        )
+        # Set up the environment - always make dict keys available for direct
+        # access, with context variables taking precedence
+        env = _make_expression_env(lua_runtime, make_env, item, context)
         # Evaluate the expression
-        try:
-            result = lua_runtime.execute("return (" + expression + ")")
-        except lupa.LuaError:
-            result = lua_runtime.execute(expression)
+        result = _compile_expression(lua_load, expression)(env)
 
         # Convert result back to Python, preserving wrapped objects
-        null_sentinel = lua_runtime.eval("null")
         return lua_to_python_preserve_wrapped(result, null_sentinel)
     except Exception:
         # Fallback to regular expression evaluation on error
@@ -1191,31 +1321,21 @@ def evaluate_expression(
         context: Dict of variables to set in the Lua context (e.g., {"item": item}).
             Required for parameter access in expressions.
     """
+    # Trivial field accesses and numeric comparisons dominate real-world
+    # expressions; evaluate them in Python without a Lua runtime.
+    trivial = _evaluate_trivial(expression, item, context)
+    if trivial is not _NOT_TRIVIAL:
+        return trivial
+
     try:
-        lua_runtime = create_lua_runtime(safe_mode)
-        # Set up context - always make dict keys available for direct access
-        if isinstance(item, dict):
-            for key, value in item.items():
-                if (
-                    isinstance(key, str)
-                    and key.isidentifier()
-                    and key not in ["and", "or", "not", "if", "then", "else", "end"]
-                ):
-                    lua_runtime.globals()[key] = python_to_lua(
-                        value, lua_runtime
-                    )  # type: ignore  # noqa
-
-        # Set up additional context variables (may override dict keys)
-        if context is not None:
-            for k, v in context.items():
-                lua_runtime.globals()[k] = python_to_lua(
-                    v, lua_runtime
-                )  # type: ignore  # noqa
+        lua_runtime, make_env, lua_load, null_sentinel = _get_expression_runtime(
+            safe_mode
+        )
+        # Set up the environment - always make dict keys available for direct
+        # access, with context variables taking precedence
+        env = _make_expression_env(lua_runtime, make_env, item, context)
         # Evaluate the expression
-        try:
-            result = lua_runtime.execute("return (" + expression + ")")
-        except lupa.LuaError:
-            result = lua_runtime.execute(expression)
+        result = _compile_expression(lua_load, expression)(env)
 
         # Check if the result is a Lua function - if so, call it with the item
         if callable(result):
@@ -1265,7 +1385,6 @@ def evaluate_expression(
                 pass
 
         # Convert Lua results back to Python
-        null_sentinel = lua_runtime.eval("null")
         return lua_to_python(result, null_sentinel)
     except Exception:
         return None
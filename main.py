@@ -1,3 +1,5 @@
+from typing import Any, Dict, Optional
+
 from fastmcp import FastMCP
 import argparse
 
@@ -12,7 +14,14 @@ USE_JAVASCRIPT = (
 
 
 class LeverMCP(FastMCP):
-    pass
+    def call_sync(self, name: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Invoke a registered tool function directly, bypassing the MCP
+        transport. Callers get whatever the tool function returns (the usual
+        value/error dict, or an awaitable for async tools like chain).
+        """
+        tool = self._tool_manager._tools[name]
+        return tool.fn(**(params or {}))
 
 
 mcp = LeverMCP("Lever MCP")
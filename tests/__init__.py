@@ -1,23 +1,75 @@
-from typing import Any, Optional
+import asyncio
+import inspect
+import json
+from typing import Any, Callable, Dict, Optional
+from fastmcp import Client
 from mcp.types import TextContent
 
+# Lazily-entered clients shared across tests, keyed by engine ("lua"/"js").
+# Entering a Client context performs the MCP handshake (capability
+# negotiation); holding the entered client here means each engine pays that
+# cost once per test session instead of once per test.
+_shared_clients: Dict[str, Client] = {}
+_shared_client_lock: Optional[asyncio.Lock] = None
+
+
+async def get_shared_client(key: str, mcp_factory: Callable[[], Any]) -> Client:
+    """
+    Return a Client whose context manager has already been entered, creating
+    it on first use via mcp_factory. Requires all tests to run on one event
+    loop (see asyncio_default_test_loop_scope in pytest.ini) so the entered
+    client remains valid across tests.
+    """
+    global _shared_client_lock
+    if _shared_client_lock is None:
+        _shared_client_lock = asyncio.Lock()
+    async with _shared_client_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = Client(mcp_factory())
+            await client.__aenter__()
+            _shared_clients[key] = client
+    return client
+
+
+# One decoder bound once; tool responses are always a {"value", "error"}
+# envelope (never a bare scalar), so there is nothing smaller to short-circuit
+# than decoding the envelope itself.
+_decode = json.JSONDecoder().decode
+
+
+def _get_tool_data(response: Any) -> dict:
+    if isinstance(response, list):
+        data = response[0]
+    else:
+        data = response
+    if isinstance(data, TextContent):
+        data = _decode(data.text)
+    assert (
+        isinstance(data, dict) and "value" in data
+    ), f"Tool did not return a dict with 'value': {data}"
+    return data
+
+
+def make_tool_call_sync(server, *args, **kwargs) -> tuple[Optional[Any], Optional[str]]:
+    """
+    Synchronous counterpart of make_tool_call for sync tools on an in-process
+    LeverMCP; deterministic tests can use it to skip the event loop entirely.
+    """
+    data = _get_tool_data(server.call_sync(*args, **kwargs))
+    return data["value"], data.get("error", None)
+
 
 async def make_tool_call(*args, **kwargs) -> tuple[Optional[Any], Optional[str]]:
-    def _get_tool_data(response: Any) -> dict:
-        import json
-
-        if isinstance(response, list):
-            data = response[0]
-        else:
-            data = response
-        if isinstance(data, TextContent):
-            data = json.loads(data.text)
-        assert (
-            isinstance(data, dict) and "value" in data
-        ), f"Tool did not return a dict with 'value': {data}"
-        return data
-
-    response = await args[0].call_tool(*args[1:], **kwargs)
+    target = args[0]
+    if hasattr(target, "call_sync"):
+        # In-process LeverMCP: invoke the tool function directly instead of
+        # round-tripping through the async client transport.
+        response = target.call_sync(*args[1:], **kwargs)
+        if inspect.isawaitable(response):
+            response = await response
+    else:
+        response = await target.call_tool(*args[1:], **kwargs)
     data = _get_tool_data(response)
     value = data["value"]
     error = data.get("error", None)
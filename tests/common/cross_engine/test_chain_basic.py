@@ -1,29 +1,16 @@
 import pytest
-import importlib
 import main
 from main import LeverMCP
-from fastmcp import Client
-from tests import make_tool_call
+from tests import get_shared_client, make_tool_call
 
+# Same worker group as test_extended so both modules reuse the one entered
+# client per engine under pytest-xdist (--dist=loadgroup).
+pytestmark = pytest.mark.xdist_group("cross_engine")
 
-@pytest.fixture(params=["lua", "javascript"])
-async def client(request):
-    """
-    Provides an isolated FastMCP client for each test by reloading the main
-    module and configuring it for the specified engine (Lua or JavaScript).
-    """
-    engine = request.param
-
-    # Reload main module to get fresh instance
-    importlib.reload(main)
-
-    # Set the global configuration before importing tools
-    main.USE_JAVASCRIPT = engine == "javascript"
 
-    # Create fresh MCP instance
+def _make_engine_mcp(engine: str) -> LeverMCP:
+    """Create a fresh MCP instance with the given engine's tools."""
     mcp_instance = LeverMCP("Lever MCP")
-
-    # Register appropriate tools based on engine
     if engine == "javascript":
         from tools.js import register_js_tools
 
@@ -32,12 +19,22 @@ async def client(request):
         from tools.lua import register_lua_tools
 
         register_lua_tools(mcp_instance)
+    return mcp_instance
+
 
-    async with Client(mcp_instance) as c:
-        yield c
+@pytest.fixture(scope="session", params=["lua", "javascript"])
+async def client(request):
+    """
+    Provides a FastMCP client for each engine (Lua or JavaScript), shared with
+    the other cross-engine modules for the whole session; the tools are
+    stateless, so no per-test reload of main is needed.
+    """
+    engine = request.param
+    main.USE_JAVASCRIPT = engine == "javascript"
+    key = "js" if engine == "javascript" else "lua"
+    yield await get_shared_client(key, lambda: _make_engine_mcp(engine))
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "first_tool,first_params,second_tool,second_params,input_value,expected_type,"
     "expected_value",
@@ -1,29 +1,22 @@
-import importlib
+import asyncio
+import json
+import random
+from collections import Counter
+
 import main
 import pytest
-from fastmcp import Client
 from main import LeverMCP
-from tests import make_tool_call
-
-
-@pytest.fixture(params=["lua", "javascript"])
-async def client(request):
-    """
-    Provides an isolated FastMCP client for each test by reloading the main
-    module and configuring it for the specified engine (Lua or JavaScript).
-    """
-    engine = request.param
+from tests import get_shared_client, make_tool_call, make_tool_call_sync
 
-    # Reload main module to get fresh instance
-    importlib.reload(main)
+# Every case here is independent and stateless; keep the module on one
+# pytest-xdist worker (run with -n auto --dist=loadgroup) so each worker pays
+# a single import and shares the per-engine clients.
+pytestmark = pytest.mark.xdist_group("cross_engine")
 
-    # Set the global configuration before importing tools
-    main.USE_JAVASCRIPT = engine == "javascript"
 
-    # Create fresh MCP instance
+def _make_engine_mcp(engine: str) -> LeverMCP:
+    """Create a fresh MCP instance with the given engine's tools."""
     mcp_instance = LeverMCP("Lever MCP")
-
-    # Register appropriate tools based on engine
     if engine == "javascript":
         from tools.js import register_js_tools
 
@@ -32,451 +25,354 @@ async def client(request):
         from tools.lua import register_lua_tools
 
         register_lua_tools(mcp_instance)
+    return mcp_instance
 
-    async with Client(mcp_instance) as c:
-        yield c
 
+@pytest.fixture(scope="session", params=["lua", "javascript"])
+async def client(request):
+    """
+    Provides a FastMCP client for each engine (Lua or JavaScript). The tools
+    are stateless, so one server and client per engine is built for the whole
+    session instead of reloading main for every test.
+    """
+    engine = request.param
+    main.USE_JAVASCRIPT = engine == "javascript"
+    key = "js" if engine == "javascript" else "lua"
+    yield await get_shared_client(key, lambda: _make_engine_mcp(engine))
 
-# --- String Manipulation Tests ---
 
+_engine_servers = {}
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "input_str, expected",
-    [
-        ("foo bar", "fooBar"),
-        ("Foo-Bar", "fooBar"),
-        ("__FOO_BAR__", "fooBar"),
-        ("foo_bar_baz", "fooBarBaz"),
-        ("", ""),
-        ("single", "single"),
-    ],
-)
-async def test_camel_case(client, input_str, expected):
-    value, error = await make_tool_call(
-        client, "strings", {"text": input_str, "operation": "camel_case"}
-    )
-    assert value == expected or (isinstance(value, dict) and "error" in value)
 
+@pytest.fixture(scope="session", params=["lua", "javascript"])
+def server(request):
+    """
+    Provides the in-process LeverMCP for each engine. make_tool_call invokes
+    its tools directly via call_sync, skipping the client transport for
+    purely deterministic cases; the client fixture keeps covering the full
+    transport path.
+    """
+    engine = request.param
+    main.USE_JAVASCRIPT = engine == "javascript"
+    srv = _engine_servers.get(engine)
+    if srv is None:
+        srv = _make_engine_mcp(engine)
+        _engine_servers[engine] = srv
+    return srv
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "input_str, expected",
-    [
-        ("foo bar", "foo-bar"),
-        ("FooBar", "foo-bar"),
-        ("foo_bar", "foo-bar"),
-        ("__FOO_BAR__", "foo-bar"),
-        ("fooBarBaz", "foo-bar-baz"),
-        ("", ""),
-    ],
-)
-async def test_kebab_case(client, input_str, expected):
-    value, error = await make_tool_call(
-        client, "strings", {"text": input_str, "operation": "kebab_case"}
-    )
-    assert value == expected or (isinstance(value, dict) and "error" in value)
 
+@pytest.fixture(scope="session")
+async def transport_client(request):
+    """
+    Client over the transport named by request.param ("inproc" or "stdio").
+    Meant for indirect parametrization, so the transport matrix applies only
+    to the smoke test below instead of duplicating every test body; HTTP gets
+    the same treatment in test_real_server.py.
+    """
+    if request.param == "inproc":
+        yield await get_shared_client("lua", lambda: _make_engine_mcp("lua"))
+    else:
+        from fastmcp import Client
+        from fastmcp.client.transports import PythonStdioTransport
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "input_str, expected",
-    [
-        ("foo bar", "foo_bar"),
-        ("FooBar", "foo_bar"),
-        ("foo-bar", "foo_bar"),
-        ("--FOO-BAR--", "foo_bar"),
-        ("fooBarBaz", "foo_bar_baz"),
-        ("", ""),
-    ],
-)
-async def test_snake_case(client, input_str, expected):
-    value, error = await make_tool_call(
-        client, "strings", {"text": input_str, "operation": "snake_case"}
-    )
-    assert value == expected or (isinstance(value, dict) and "error" in value)
+        transport = PythonStdioTransport("main.py", args=["--lua"])
+        async with Client(transport) as stdio_client:
+            yield stdio_client
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "input_str, expected",
-    [
-        ("foo bar", "Foo bar"),
-        ("FOO BAR", "Foo bar"),
-        (" foo bar", " foo bar"),
-        ("", ""),
-    ],
-)
-async def test_capitalize(client, input_str, expected):
+@pytest.mark.parametrize("transport_client", ["inproc", "stdio"], indirect=True)
+async def test_transport_smoke(transport_client):
     value, error = await make_tool_call(
-        client, "strings", {"text": input_str, "operation": "capitalize"}
+        transport_client, "strings", {"text": "hello", "operation": "upper_case"}
     )
-    assert value == expected or (isinstance(value, dict) and "error" in value)
+    assert error is None
+    assert value == "HELLO"
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "text, target, expected",
-    [
-        ("abc", "a", True),
-        ("abc", "b", False),
-        ("abc", "", True),
-        ("", "", True),
-    ],
-)
-async def test_starts_with(client, text, target, expected):
-    value, error = await make_tool_call(
-        client,
-        "strings",
-        {"text": text, "operation": "starts_with", "param": target},
-    )
-    assert value is expected or (isinstance(value, dict) and "error" in value)
-
+# --- String Manipulation Tests ---
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "text, target, expected",
-    [
-        ("abc", "c", True),
-        ("abc", "b", False),
-        ("abc", "", True),
-        ("", "", True),
-    ],
+# One (operation, text, param, data, expected) table drives every strings
+# case below; a single test function keeps collection and fixture resolution
+# to one parametrize block instead of seven.
+_STRINGS_OP_CASES = (
+    ("camel_case", "foo bar", None, None, "fooBar"),
+    ("camel_case", "Foo-Bar", None, None, "fooBar"),
+    ("camel_case", "__FOO_BAR__", None, None, "fooBar"),
+    ("camel_case", "foo_bar_baz", None, None, "fooBarBaz"),
+    ("camel_case", "", None, None, ""),
+    ("camel_case", "single", None, None, "single"),
+    ("kebab_case", "foo bar", None, None, "foo-bar"),
+    ("kebab_case", "FooBar", None, None, "foo-bar"),
+    ("kebab_case", "foo_bar", None, None, "foo-bar"),
+    ("kebab_case", "__FOO_BAR__", None, None, "foo-bar"),
+    ("kebab_case", "fooBarBaz", None, None, "foo-bar-baz"),
+    ("kebab_case", "", None, None, ""),
+    ("snake_case", "foo bar", None, None, "foo_bar"),
+    ("snake_case", "FooBar", None, None, "foo_bar"),
+    ("snake_case", "foo-bar", None, None, "foo_bar"),
+    ("snake_case", "--FOO-BAR--", None, None, "foo_bar"),
+    ("snake_case", "fooBarBaz", None, None, "foo_bar_baz"),
+    ("snake_case", "", None, None, ""),
+    ("capitalize", "foo bar", None, None, "Foo bar"),
+    ("capitalize", "FOO BAR", None, None, "Foo bar"),
+    ("capitalize", " foo bar", None, None, " foo bar"),
+    ("capitalize", "", None, None, ""),
+    ("starts_with", "abc", "a", None, True),
+    ("starts_with", "abc", "b", None, False),
+    ("starts_with", "abc", "", None, True),
+    ("starts_with", "", "", None, True),
+    ("ends_with", "abc", "c", None, True),
+    ("ends_with", "abc", "b", None, False),
+    ("ends_with", "abc", "", None, True),
+    ("ends_with", "", "", None, True),
+    ("reverse", "hello", None, None, "olleh"),
+    ("trim", "  hello  ", None, None, "hello"),
+    ("lower_case", "Hello World", None, None, "hello world"),
+    ("upper_case", "Hello World", None, None, "HELLO WORLD"),
+    ("replace", "foo bar foo", None, {"old": "foo", "new": "baz"}, "baz bar baz"),
 )
-async def test_ends_with(client, text, target, expected):
-    value, error = await make_tool_call(
-        client, "strings", {"text": text, "operation": "ends_with", "param": target}
-    )
-    assert value is expected or (isinstance(value, dict) and "error" in value)
-
-
-# --- General Utility Tests ---
 
-
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "value, expected",
-    [
-        ([], True),
-        ({}, True),
-        ("", True),
-        ([1], False),
-        ({"a": 1}, False),
-        ("a", False),
-        (None, True),
-        (0, True),
-        (False, True),
-    ],
+# Mutations assert strict equality; the conversion/predicate cases keep the
+# historical escape hatch for engines that report an error dict instead.
+_STRICT_STRINGS_OPS = frozenset(
+    ["reverse", "trim", "lower_case", "upper_case", "replace"]
 )
-async def test_is_empty(client, value, expected):
-    if isinstance(value, str):
-        value_out, error = await make_tool_call(
-            client, "strings", {"text": value, "operation": "is_empty"}
-        )
-    elif isinstance(value, list):
-        value_out, error = await make_tool_call(
-            client, "lists", {"items": value, "operation": "is_empty"}
-        )
-    elif isinstance(value, dict):
-        value_out, error = await make_tool_call(
-            client, "dicts", {"obj": value, "operation": "is_empty"}
-        )
-    else:
-        value_out, error = await make_tool_call(
-            client, "any", {"value": value, "operation": "is_empty"}
-        )
-    assert value_out is expected
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        ("foo", "foo", True),
-        (42, 42, True),
-        (3.14, 3.14, True),
-        (True, True, True),
-        ([1, 2], [1, 2], True),
-        ({"a": 1}, {"a": 1}, True),
-        (None, None, True),
-        ("foo", "bar", False),
-        (42, 43, False),
-        (3.14, 2.71, False),
-        (True, False, False),
-        ([1, 2], [2, 1], False),
-        ({"a": 1}, {"a": 2}, False),
-        (None, 0, False),
-    ],
-)
-async def test_is_equal_all_types(client, a, b, expected):
-    if isinstance(a, str) and isinstance(b, str):
-        value_out, error = await make_tool_call(
-            client, "strings", {"text": a, "operation": "is_equal", "param": b}
-        )
-    elif isinstance(a, list) and isinstance(b, list):
-        value_out, error = await make_tool_call(
-            client, "lists", {"items": a, "operation": "is_equal", "param": b}
-        )
-    elif isinstance(a, dict) and isinstance(b, dict):
-        value_out, error = await make_tool_call(
-            client, "dicts", {"obj": a, "operation": "is_equal", "param": b}
-        )
+@pytest.mark.parametrize("operation, text, param, data, expected", _STRINGS_OP_CASES)
+def test_strings_op(server, operation, text, param, data, expected):
+    params = {"text": text, "operation": operation}
+    if param is not None:
+        params["param"] = param
+    if data is not None:
+        params["data"] = data
+    value, error = make_tool_call_sync(server, "strings", params)
+    if operation in _STRICT_STRINGS_OPS:
+        assert value == expected
+    elif isinstance(expected, bool):
+        assert value is expected or (isinstance(value, dict) and "error" in value)
     else:
-        value_out, error = await make_tool_call(
-            client, "any", {"value": a, "operation": "is_equal", "param": b}
-        )
-    assert value_out is expected
+        assert value == expected or (isinstance(value, dict) and "error" in value)
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "value, expected",
-    [
-        (None, True),
-        (0, False),
-        (1, False),
-        (3.14, False),
-        ("", False),
-        ("foo", False),
-        ([], False),
-        ([1, 2], False),
-        ({}, False),
-        ({"a": 1}, False),
-        (False, False),
-        (True, False),
-    ],
-)
-async def test_any_is_nil(client, value, expected):
-    value_out, error = await make_tool_call(
-        client, "any", {"value": value, "operation": "is_nil"}
-    )
-    assert value_out is expected
-
+# --- General Utility Tests ---
 
-# --- List Manipulation Tests ---
+# Maps a value's type to the tool and input key that handle it; anything not
+# listed (numbers, bools, None) goes through the generic "any" tool.
+TOOL_FOR_TYPE = {
+    str: ("strings", "text"),
+    list: ("lists", "items"),
+    dict: ("dicts", "obj"),
+}
+
+
+_IS_EMPTY_CASES = (
+    ([], True),
+    ({}, True),
+    ("", True),
+    ([1], False),
+    ({"a": 1}, False),
+    ("a", False),
+    (None, True),
+    (0, True),
+    (False, True),
+)
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "items, expected",
-    [
-        ([1, 2, 3], 1),
-        ([None, 2, 3], None),
-        ([], None),
-    ],
+async def test_is_empty(client):
+    calls = []
+    for value, _ in _IS_EMPTY_CASES:
+        tool, key = TOOL_FOR_TYPE.get(type(value), ("any", "value"))
+        calls.append(
+            make_tool_call(client, tool, {key: value, "operation": "is_empty"})
+        )
+    results = await asyncio.gather(*calls)
+    for (value, expected), (value_out, error) in zip(_IS_EMPTY_CASES, results):
+        assert value_out is expected, f"is_empty({value!r})"
+
+
+_IS_EQUAL_CASES = (
+    ("foo", "foo", True),
+    (42, 42, True),
+    (3.14, 3.14, True),
+    (True, True, True),
+    ([1, 2], [1, 2], True),
+    ({"a": 1}, {"a": 1}, True),
+    (None, None, True),
+    ("foo", "bar", False),
+    (42, 43, False),
+    (3.14, 2.71, False),
+    (True, False, False),
+    ([1, 2], [2, 1], False),
+    ({"a": 1}, {"a": 2}, False),
+    (None, 0, False),
 )
-async def test_head(client, items, expected):
-    value, error = await make_tool_call(
-        client, "lists", {"items": items, "operation": "head"}
-    )
-    if expected is None:
-        assert value is None
-    else:
-        assert value is not None
-        assert value == expected
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "items, expected",
-    [
-        ([1, 2, 3], [2, 3]),
-        ([1], []),
-        ([], []),
-    ],
+async def test_is_equal_all_types(client):
+    calls = []
+    for a, b, _ in _IS_EQUAL_CASES:
+        if type(a) is type(b):
+            tool, key = TOOL_FOR_TYPE.get(type(a), ("any", "value"))
+        else:
+            tool, key = "any", "value"
+        calls.append(
+            make_tool_call(client, tool, {key: a, "operation": "is_equal", "param": b})
+        )
+    results = await asyncio.gather(*calls)
+    for (a, b, expected), (value_out, error) in zip(_IS_EQUAL_CASES, results):
+        assert value_out is expected, f"is_equal({a!r}, {b!r})"
+
+
+_IS_NIL_CASES = (
+    (None, True),
+    (0, False),
+    (1, False),
+    (3.14, False),
+    ("", False),
+    ("foo", False),
+    ([], False),
+    ([1, 2], False),
+    ({}, False),
+    ({"a": 1}, False),
+    (False, False),
+    (True, False),
 )
-async def test_tail(client, items, expected):
-    value, error = await make_tool_call(
-        client, "lists", {"items": items, "operation": "tail"}
-    )
-    if not value:
-        assert expected == []
-    else:
-        assert value == expected
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "items, expected",
-    [
-        ([1, 2, 3], 3),
-        ([1, 2, None], None),
-        ([], None),
-    ],
-)
-async def test_last(client, items, expected):
-    value, error = await make_tool_call(
-        client, "lists", {"items": items, "operation": "last"}
+async def test_any_is_nil(client):
+    results = await asyncio.gather(
+        *(
+            make_tool_call(client, "any", {"value": value, "operation": "is_nil"})
+            for value, _ in _IS_NIL_CASES
+        )
     )
-    if not value:
-        assert expected is None
-    else:
-        assert value == expected
+    for (value, expected), (value_out, error) in zip(_IS_NIL_CASES, results):
+        assert value_out is expected, f"is_nil({value!r})"
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "items, expected",
-    [
-        ([1, 2, 3], [1, 2]),
-        ([1], []),
-        ([], []),
-    ],
-)
-async def test_initial(client, items, expected):
-    value, error = await make_tool_call(
-        client, "lists", {"items": items, "operation": "initial"}
-    )
-    if not value:
-        assert expected == []
-    else:
-        assert value == expected
+# --- List Manipulation Tests ---
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "items, n, expected",
-    [
-        ([1, 2, 3], 1, [2, 3]),
-        ([1, 2, 3], 0, [1, 2, 3]),
-        ([1, 2, 3], 5, []),
-        ([], 2, []),
-    ],
+def _unwrap(value):
+    """
+    Normalize a list of {"value": ...} wrapper dicts back to raw values;
+    anything else passes through untouched.
+    """
+    if (
+        isinstance(value, list)
+        and value
+        and all(isinstance(x, dict) and "value" in x for x in value)
+    ):
+        return [x["value"] for x in value]
+    return value
+
+
+def _dkey(d):
+    """Canonical key for comparing dicts order-insensitively in sets."""
+    return json.dumps(d, sort_keys=True)
+
+
+# One (operation, items, param, expected) table covers the positional list
+# selectors; a single test keeps them to one pytest item per row instead of
+# eight separate functions with the same skeleton.
+_LIST_SLICE_CASES = (
+    ("head", [1, 2, 3], None, 1),
+    ("head", [None, 2, 3], None, None),
+    ("head", [], None, None),
+    ("tail", [1, 2, 3], None, [2, 3]),
+    ("tail", [1], None, []),
+    ("tail", [], None, []),
+    ("last", [1, 2, 3], None, 3),
+    ("last", [1, 2, None], None, None),
+    ("last", [], None, None),
+    ("initial", [1, 2, 3], None, [1, 2]),
+    ("initial", [1], None, []),
+    ("initial", [], None, []),
+    ("drop", [1, 2, 3], 1, [2, 3]),
+    ("drop", [1, 2, 3], 0, [1, 2, 3]),
+    ("drop", [1, 2, 3], 5, []),
+    ("drop", [], 2, []),
+    ("drop_right", [1, 2, 3], 1, [1, 2]),
+    ("drop_right", [1, 2, 3], 0, [1, 2, 3]),
+    ("drop_right", [1, 2, 3], 5, []),
+    ("drop_right", [], 2, []),
+    ("take", [1, 2, 3], 2, [1, 2]),
+    ("take", [1, 2, 3], 0, []),
+    ("take", [1, 2, 3], 5, [1, 2, 3]),
+    ("take", [], 2, []),
+    ("take_right", [1, 2, 3], 2, [2, 3]),
+    ("take_right", [1, 2, 3], 0, []),
+    ("take_right", [1, 2, 3], 5, [1, 2, 3]),
+    ("take_right", [], 2, []),
 )
-async def test_drop(client, items, n, expected):
-    value, error = await make_tool_call(
-        client, "lists", {"items": items, "operation": "drop", "param": n}
-    )
-    if not value:
-        assert expected == []
-    else:
-        assert value == expected
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "items, n, expected",
-    [
-        ([1, 2, 3], 1, [1, 2]),
-        ([1, 2, 3], 0, [1, 2, 3]),
-        ([1, 2, 3], 5, []),
-        ([], 2, []),
-    ],
+    "operation, items, param, expected",
+    _LIST_SLICE_CASES,
+    ids=[f"{case[0]}-{i}" for i, case in enumerate(_LIST_SLICE_CASES)],
 )
-async def test_drop_right(client, items, n, expected):
-    value, error = await make_tool_call(
-        client, "lists", {"items": items, "operation": "drop_right", "param": n}
-    )
-    if not value:
+def test_lists_slice_op(server, operation, items, param, expected):
+    params = {"items": items, "operation": operation}
+    if param is not None:
+        params["param"] = param
+    value, error = make_tool_call_sync(server, "lists", params)
+    if expected is None or not isinstance(expected, list):
+        # head/last return a scalar (None for empty or nil-valued positions).
+        assert value == expected
+    elif not value:
+        # Engines may report an empty result as None or []; either is fine
+        # only when the expectation is empty.
         assert expected == []
     else:
+        value = _unwrap(value)
+        if len(expected) == 1 and not isinstance(value, list):
+            value = [value]
         assert value == expected
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "items, n, expected",
-    [
-        ([1, 2, 3], 2, [1, 2]),
-        ([1, 2, 3], 0, []),
-        ([1, 2, 3], 5, [1, 2, 3]),
-        ([], 2, []),
-    ],
+_FLATTEN_CASES = (
+    ([[1, 2], [3, 4]], [1, 2, 3, 4]),
+    ([[], [1]], [1]),
+    ([[]], []),
+    ([], []),
+    ([1, [2, 3]], [1, 2, 3]),  # Non-list elements preserved
+    ([1, 2, [3, 4]], [1, 2, 3, 4]),  # Multiple non-list elements
 )
-async def test_take(client, items, n, expected):
-    value, error = await make_tool_call(
-        client, "lists", {"items": items, "operation": "take", "param": n}
-    )
-    if not value:
-        assert expected == []
-    else:
-        if (
-            isinstance(value, list)
-            and value
-            and all(isinstance(x, dict) and "value" in x for x in value)
-        ):
-            value = [x["value"] for x in value]
-        if (
-            isinstance(value, list)
-            and value
-            and all(isinstance(x, dict) and "value" in x for x in value)
-        ):
-            value = [x["value"] for x in value]
-        if len(expected) == 1 and not isinstance(value, list):
-            assert [value] == expected
-        else:
-            assert value == expected
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "items, n, expected",
-    [
-        ([1, 2, 3], 2, [2, 3]),
-        ([1, 2, 3], 0, []),
-        ([1, 2, 3], 5, [1, 2, 3]),
-        ([], 2, []),
-    ],
+    "items, expected",
+    _FLATTEN_CASES,
+    ids=[f"case{i}" for i in range(len(_FLATTEN_CASES))],
 )
-async def test_take_right(client, items, n, expected):
-    value, error = await make_tool_call(
-        client, "lists", {"items": items, "operation": "take_right", "param": n}
+def test_flatten(server, items, expected):
+    value, error = make_tool_call_sync(
+        server, "lists", {"items": items, "operation": "flatten"}
     )
     if not value:
         assert expected == []
     else:
-        if (
-            isinstance(value, list)
-            and value
-            and all(isinstance(x, dict) and "value" in x for x in value)
-        ):
-            value = [x["value"] for x in value]
+        value = _unwrap(value)
         if len(expected) == 1 and not isinstance(value, list):
             assert [value] == expected
         else:
             assert value == expected
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "items, expected",
-    [
-        ([[1, 2], [3, 4]], [1, 2, 3, 4]),
-        ([[], [1]], [1]),
-        ([[]], []),
-        ([], []),
-        ([1, [2, 3]], [1, 2, 3]),  # Non-list elements preserved
-        ([1, 2, [3, 4]], [1, 2, 3, 4]),  # Multiple non-list elements
-    ],
+_UNION_CASES = (
+    ([[1, 2], [2, 3]], [1, 2, 3]),
+    ([[], [1]], [1]),
+    ([[1, 2], [3, 4]], [1, 2, 3, 4]),
+    ([], []),
 )
-async def test_flatten(client, items, expected):
-    value, error = await make_tool_call(
-        client, "lists", {"items": items, "operation": "flatten"}
-    )
-    if not value:
-        assert expected == []
-    else:
-        if (
-            isinstance(value, list)
-            and value
-            and all(isinstance(x, dict) and "value" in x for x in value)
-        ):
-            value = [x["value"] for x in value]
-        if len(expected) == 1 and not isinstance(value, list):
-            assert [value] == expected
-        else:
-            assert value == expected
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "lists, expected",
-    [
-        ([[1, 2], [2, 3]], [1, 2, 3]),
-        ([[], [1]], [1]),
-        ([[1, 2], [3, 4]], [1, 2, 3, 4]),
-        ([], []),
-    ],
+    _UNION_CASES,
+    ids=[f"case{i}" for i in range(len(_UNION_CASES))],
 )
 async def test_union(client, lists, expected):
     value, error = await make_tool_call(
@@ -486,20 +382,23 @@ async def test_union(client, lists, expected):
         assert expected == []
     else:
         if isinstance(value, list):
-            assert sorted(value) == sorted(expected)
+            assert Counter(value) == Counter(expected)
         else:
             assert [value] == expected
 
 
-@pytest.mark.asyncio
+_INTERSECTION_CASES = (
+    ([[1, 2, 3], [2, 3, 4], [2, 5]], [2, 3]),
+    ([[1, 2], [3, 4]], []),
+    ([[], [1, 2]], []),
+    ([], []),
+)
+
+
 @pytest.mark.parametrize(
     "lists, expected",
-    [
-        ([[1, 2, 3], [2, 3, 4], [2, 5]], [2, 3]),
-        ([[1, 2], [3, 4]], []),
-        ([[], [1, 2]], []),
-        ([], []),
-    ],
+    _INTERSECTION_CASES,
+    ids=[f"case{i}" for i in range(len(_INTERSECTION_CASES))],
 )
 async def test_intersection(client, lists, expected):
     if len(lists) < 2:
@@ -513,12 +412,7 @@ async def test_intersection(client, lists, expected):
     if not value:
         assert expected == []
     else:
-        if (
-            isinstance(value, list)
-            and value
-            and all(isinstance(x, dict) and "value" in x for x in value)
-        ):
-            value = [x["value"] for x in value]
+        value = _unwrap(value)
         if not isinstance(value, list):
             value = [value]
         if (
@@ -528,34 +422,30 @@ async def test_intersection(client, lists, expected):
             and expected
         ):
             primitive_types = (int, float, str, bool, type(None))
-            t = type(value[0])
-            if all(
-                isinstance(x, primitive_types) and type(x) == t  # noqa
-                for x in value + expected
-            ):
-                assert set(value) == set(expected)
-            elif all(isinstance(x, dict) for x in value + expected):
-
-                def dicts_to_set(lst):
-                    return set(tuple(sorted(d.items())) for d in lst)
-
-                assert dicts_to_set(value) == dicts_to_set(expected)
-            elif all(isinstance(x, list) for x in value + expected):
-                assert set(tuple(x) for x in value) == set(tuple(x) for x in expected)
+            types = {type(x) for x in value} | {type(x) for x in expected}
+            if len(types) == 1 and issubclass(next(iter(types)), primitive_types):
+                assert Counter(value) == Counter(expected)
+            elif types == {dict}:
+                assert {_dkey(d) for d in value} == {_dkey(d) for d in expected}
+            elif types == {list}:
+                assert Counter(map(tuple, value)) == Counter(map(tuple, expected))
             else:
                 assert value == expected
         else:
             assert value == expected
 
 
-@pytest.mark.asyncio
+_DIFFERENCE_CASES = (
+    ([1, 2, 3], [[2, 4]], [1, 3]),
+    ([1, 2, 3], [[4, 5]], [1, 2, 3]),
+    ([], [[1]], []),
+)
+
+
 @pytest.mark.parametrize(
     "items, others, expected",
-    [
-        ([1, 2, 3], [[2, 4]], [1, 3]),
-        ([1, 2, 3], [[4, 5]], [1, 2, 3]),
-        ([], [[1]], []),
-    ],
+    _DIFFERENCE_CASES,
+    ids=[f"case{i}" for i in range(len(_DIFFERENCE_CASES))],
 )
 async def test_difference(client, items, others, expected):
     if not others or not others[0]:
@@ -572,114 +462,126 @@ async def test_difference(client, items, others, expected):
         assert value == expected
 
 
-@pytest.mark.asyncio
+_XOR_CASES = (
+    ([[1, 2], [2, 3]], [1, 3]),
+    ([[1, 2, 3], [2, 4, 5]], [1, 3, 4, 5]),
+    ([[], [1, 2]], [1, 2]),
+)
+
+
 @pytest.mark.parametrize(
     "lists, expected",
-    [
-        ([[1, 2], [2, 3]], [1, 3]),
-        ([[1, 2, 3], [2, 4, 5]], [1, 3, 4, 5]),
-        ([[], [1, 2]], [1, 2]),
-    ],
+    _XOR_CASES,
+    ids=[f"case{i}" for i in range(len(_XOR_CASES))],
 )
 async def test_xor(client, lists, expected):
     value, error = await make_tool_call(
         client, "lists", {"items": lists[0], "others": lists[1], "operation": "xor"}
     )
-    if (
-        isinstance(value, list)
-        and value
-        and all(isinstance(x, dict) and "value" in x for x in value)
-    ):
-        value = [x["value"] for x in value]
-    assert value == expected
+    assert _unwrap(value) == expected
 
 
 # --- Object/Dict Manipulation Tests ---
 
 
-@pytest.mark.asyncio
+_PICK_CASES = (
+    ({"a": 1, "b": 2}, ["a"], {"a": 1}),
+    ({"a": 1, "b": 2}, ["a", "c"], {"a": 1}),
+    ({}, ["a"], {}),
+)
+
+
 @pytest.mark.parametrize(
     "obj, keys, expected",
-    [
-        ({"a": 1, "b": 2}, ["a"], {"a": 1}),
-        ({"a": 1, "b": 2}, ["a", "c"], {"a": 1}),
-        ({}, ["a"], {}),
-    ],
+    _PICK_CASES,
+    ids=[f"case{i}" for i in range(len(_PICK_CASES))],
 )
-async def test_pick(client, obj, keys, expected):
-    value, error = await make_tool_call(
-        client, "dicts", {"obj": obj, "operation": "pick", "param": keys}
+def test_pick(server, obj, keys, expected):
+    value, error = make_tool_call_sync(
+        server, "dicts", {"obj": obj, "operation": "pick", "param": keys}
     )
     assert error is None
     assert value == expected
 
 
-@pytest.mark.asyncio
+_OMIT_CASES = (
+    ({"a": 1, "b": 2}, ["a"], {"b": 2}),
+    ({"a": 1, "b": 2}, ["c"], {"a": 1, "b": 2}),
+    ({}, ["a"], {}),
+)
+
+
 @pytest.mark.parametrize(
     "obj, keys, expected",
-    [
-        ({"a": 1, "b": 2}, ["a"], {"b": 2}),
-        ({"a": 1, "b": 2}, ["c"], {"a": 1, "b": 2}),
-        ({}, ["a"], {}),
-    ],
+    _OMIT_CASES,
+    ids=[f"case{i}" for i in range(len(_OMIT_CASES))],
 )
-async def test_omit(client, obj, keys, expected):
-    value, error = await make_tool_call(
-        client, "dicts", {"obj": obj, "operation": "omit", "param": keys}
+def test_omit(server, obj, keys, expected):
+    value, error = make_tool_call_sync(
+        server, "dicts", {"obj": obj, "operation": "omit", "param": keys}
     )
     assert error is None
     assert value == expected
 
 
-@pytest.mark.asyncio
+_INVERT_CASES = (
+    ({"a": "x", "b": "y"}, {"x": "a", "y": "b"}),
+    ({"a": 1}, {"1": "a"}),
+    ({}, {}),
+)
+
+
 @pytest.mark.parametrize(
     "obj, expected",
-    [
-        ({"a": "x", "b": "y"}, {"x": "a", "y": "b"}),
-        ({"a": 1}, {"1": "a"}),
-        ({}, {}),
-    ],
+    _INVERT_CASES,
+    ids=[f"case{i}" for i in range(len(_INVERT_CASES))],
 )
-async def test_invert(client, obj, expected):
-    value, error = await make_tool_call(
-        client, "dicts", {"obj": obj, "operation": "invert"}
+def test_invert(server, obj, expected):
+    value, error = make_tool_call_sync(
+        server, "dicts", {"obj": obj, "operation": "invert"}
     )
     assert error is None
     assert value == expected
 
 
-@pytest.mark.asyncio
+_HAS_CASES = (
+    ({"a": 1}, "a", True),
+    ({"a": 1}, "b", False),
+    ({}, "a", False),
+)
+
+
 @pytest.mark.parametrize(
     "obj, key, expected",
-    [
-        ({"a": 1}, "a", True),
-        ({"a": 1}, "b", False),
-        ({}, "a", False),
-    ],
+    _HAS_CASES,
+    ids=[f"case{i}" for i in range(len(_HAS_CASES))],
 )
-async def test_has(client, obj, key, expected):
-    value, error = await make_tool_call(
-        client, "dicts", {"obj": obj, "operation": "has_key", "param": key}
+def test_has(server, obj, key, expected):
+    value, error = make_tool_call_sync(
+        server, "dicts", {"obj": obj, "operation": "has_key", "param": key}
     )
     assert error is None
     assert value == expected
 
 
-@pytest.mark.asyncio
+_KEY_BY_CASES = (
+    (
+        [{"id": "a", "v": 1}, {"id": "b", "v": 2}],
+        "id",
+        {"a": {"id": "a", "v": 1}, "b": {"id": "b", "v": 2}},
+    ),
+    ([], "id", {}),
+)
+
+
 @pytest.mark.parametrize(
     "items, expression, expected",
-    [
-        (
-            [{"id": "a", "v": 1}, {"id": "b", "v": 2}],
-            "id",
-            {"a": {"id": "a", "v": 1}, "b": {"id": "b", "v": 2}},
-        ),
-        ([], "id", {}),
-    ],
+    _KEY_BY_CASES,
+    ids=[f"case{i}" for i in range(len(_KEY_BY_CASES))],
 )
-async def test_key_by(client, items, expression, expected):
-    value, error = await make_tool_call(
-        client,
+def test_key_by(server, items, expression, expected):
+    value, error = make_tool_call_sync(
+        server,
         "lists",
         {"items": items, "operation": "key_by", "expression": expression},
     )
@@ -689,51 +591,49 @@ async def test_key_by(client, items, expression, expected):
 
 # --- Randomized Tests ---
 
+# Property-style generated cases: a fixed seed keeps the inputs deterministic
+# across runs while covering many more shapes than the old hand-picked lists.
+_rng = random.Random(0)
+_RANDOMIZED_CASES = tuple(
+    [_rng.randint(-100, 100) for _ in range(_rng.randint(2, 20))] for _ in range(25)
+)
 
-@pytest.mark.asyncio
-async def test_shuffle(client):
-    items = [1, 2, 3, 4, 5]
-    value, error = await make_tool_call(
-        client, "lists", {"items": items, "operation": "shuffle"}
-    )
-    assert value is not None
-    assert len(value) == len(items)
-    assert sorted(value) == sorted(items)
 
+async def test_randomized_list_invariants(client):
+    """Shuffle and sample invariants hold across generated inputs."""
 
-@pytest.mark.asyncio
-async def test_sample(client):
-    items = [1, 2, 3, 4, 5]
-    value, error = await make_tool_call(
-        client, "lists", {"items": items, "operation": "sample"}
-    )
-    assert value is not None
-    assert value in items
-    value_empty, error = await make_tool_call(
-        client, "lists", {"items": [], "operation": "sample"}
-    )
-    assert value_empty is None
+    async def check(items):
+        n = len(items) // 2 + 1
+        shuffled, sampled, sized = await asyncio.gather(
+            make_tool_call(client, "lists", {"items": items, "operation": "shuffle"}),
+            make_tool_call(client, "lists", {"items": items, "operation": "sample"}),
+            make_tool_call(
+                client,
+                "lists",
+                {"items": items, "operation": "sample_size", "param": n},
+            ),
+        )
+        value, error = shuffled
+        assert value is not None, f"shuffle({items!r})"
+        assert len(value) == len(items), f"shuffle({items!r})"
+        assert Counter(value) == Counter(items), f"shuffle({items!r})"
+        value, error = sampled
+        assert value in items, f"sample({items!r})"
+        value, error = sized
+        assert value is not None, f"sample_size({items!r}, {n})"
+        assert len(value) == min(n, len(items)), f"sample_size({items!r}, {n})"
+        assert all(item in items for item in value), f"sample_size({items!r}, {n})"
 
+    await asyncio.gather(*(check(items) for items in _RANDOMIZED_CASES))
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "items, n",
-    [
-        ([1, 2, 3, 4, 5], 3),
-        ([1, 2, 3], 5),  # n > len(items)
-        ([1, 2, 3], 3),  # n == len(items)
-    ],
-)
-async def test_sample_size(client, items, n):
+
+async def test_sample_empty(client):
     value, error = await make_tool_call(
-        client, "lists", {"items": items, "operation": "sample_size", "param": n}
+        client, "lists", {"items": [], "operation": "sample"}
     )
-    assert value is not None
-    assert len(value) == min(n, len(items))
-    assert all(item in items for item in value)
+    assert value is None
 
 
-@pytest.mark.asyncio
 async def test_sample_size_empty(client):
     value, error = await make_tool_call(
         client, "lists", {"items": [], "operation": "sample_size", "param": 3}
@@ -741,43 +641,84 @@ async def test_sample_size_empty(client):
     assert value == []
 
 
-# --- Additional mutate_string tests ---
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "input_str, mutation, data, expected",
-    [
-        ("hello", "reverse", None, "olleh"),
-        ("  hello  ", "trim", None, "hello"),
-        ("Hello World", "lower_case", None, "hello world"),
-        ("Hello World", "upper_case", None, "HELLO WORLD"),
-        ("foo bar foo", "replace", {"old": "foo", "new": "baz"}, "baz bar baz"),
-    ],
+# Generated values for the emptiness predicates; each iteration builds all
+# candidate shapes before choosing one, so the fixed seed keeps the sequence
+# stable across runs.
+_prop_rng = random.Random(1)
+_PROPERTY_VALUES = tuple(
+    _prop_rng.choice(
+        [
+            None,
+            _prop_rng.randint(-5, 5),
+            bool(_prop_rng.getrandbits(1)),
+            "x" * _prop_rng.randint(0, 3),
+            [_prop_rng.randint(0, 9) for _ in range(_prop_rng.randint(0, 3))],
+            {f"k{i}": i for i in range(_prop_rng.randint(0, 3))},
+        ]
+    )
+    for _ in range(30)
 )
-async def test_mutate_string_new_options(client, input_str, mutation, data, expected):
-    params = {"text": input_str, "operation": mutation}
-    if data is not None:
-        params["data"] = data
-    value, error = await make_tool_call(client, "strings", params)
+
+
+async def test_generated_emptiness_predicates(client):
+    """is_empty and is_nil agree with Python semantics over generated values."""
+
+    async def check(value):
+        tool, key = TOOL_FOR_TYPE.get(type(value), ("any", "value"))
+        empty, nil = await asyncio.gather(
+            make_tool_call(client, tool, {key: value, "operation": "is_empty"}),
+            make_tool_call(client, "any", {"value": value, "operation": "is_nil"}),
+        )
+        assert empty[0] is (not bool(value)), f"is_empty({value!r})"
+        assert nil[0] is (value is None), f"is_nil({value!r})"
+
+    await asyncio.gather(*(check(value) for value in _PROPERTY_VALUES))
+
+
+def test_shuffle_sample_deterministic_with_seed(server):
+    """
+    Both engines delegate shuffle/sample to tools.common.lists, which draws
+    from the stdlib module RNG; seeding it in-process pins the exact output,
+    so rerun filters like --lf compare stable results instead of only
+    permutation invariants.
+    """
+    items = list(range(10))
+
+    random.seed(1234)
+    value, error = make_tool_call_sync(
+        server, "lists", {"items": items, "operation": "shuffle"}
+    )
+    random.seed(1234)
+    expected = items[:]
+    random.shuffle(expected)
+    assert error is None
     assert value == expected
 
+    random.seed(99)
+    value, error = make_tool_call_sync(
+        server, "lists", {"items": items, "operation": "sample_size", "param": 4}
+    )
+    random.seed(99)
+    assert error is None
+    assert value == random.sample(items, 4)
+
 
 # --- Additional has_property tests ---
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "obj, property, param, expected",
-    [
-        ("hello world", "contains", "world", True),
-        ([1, 2, 3], "contains", 2, True),
-        ("12345", "is_digit", None, True),
-        ("abcXYZ", "is_alpha", None, True),
-        ("HELLO", "is_upper", None, True),
-        ("hello", "is_lower", None, True),
-        ("abc123", "is_digit", None, False),
-        ("abc123", "is_alpha", None, False),
-        ("Hello", "is_upper", None, False),
-        ("Hello", "is_lower", None, False),
-    ],
+_HAS_PROPERTY_CASES = (
+    ("hello world", "contains", "world", True),
+    ([1, 2, 3], "contains", 2, True),
+    ("12345", "is_digit", None, True),
+    ("abcXYZ", "is_alpha", None, True),
+    ("HELLO", "is_upper", None, True),
+    ("hello", "is_lower", None, True),
+    ("abc123", "is_digit", None, False),
+    ("abc123", "is_alpha", None, False),
+    ("Hello", "is_upper", None, False),
+    ("Hello", "is_lower", None, False),
 )
+
+
+@pytest.mark.parametrize("obj, property, param, expected", _HAS_PROPERTY_CASES)
 async def test_has_property_new_options(client, obj, property, param, expected):
     if isinstance(obj, str):
         params = {"text": obj, "operation": property}
@@ -802,22 +743,25 @@ async def test_has_property_new_options(client, obj, property, param, expected):
 
 
 # --- Additional select_from_list tests ---
-@pytest.mark.asyncio
+_SELECT_FROM_LIST_NEW_OPTIONS_CASES = (
+    ([10, 20, 30], "nth", 1, 20),
+    ([10, 20, 30], "nth", -1, 30),
+    ([{"score": 5}, {"score": 2}, {"score": 8}], "min_by", "score", {"score": 2}),
+    ([{"score": 5}, {"score": 2}, {"score": 8}], "max_by", "score", {"score": 8}),
+    ([{"id": 1}, {"id": 2}, {"id": 3}], "index_of", "id == 2", 1),
+    (
+        [{"status": "active"}, {"status": "inactive"}, {"status": "active"}],
+        "random_except",
+        "status == 'inactive'",
+        {"status": "active"},
+    ),
+)
+
+
 @pytest.mark.parametrize(
     "items, operation, param, expected",
-    [
-        ([10, 20, 30], "nth", 1, 20),
-        ([10, 20, 30], "nth", -1, 30),
-        ([{"score": 5}, {"score": 2}, {"score": 8}], "min_by", "score", {"score": 2}),
-        ([{"score": 5}, {"score": 2}, {"score": 8}], "max_by", "score", {"score": 8}),
-        ([{"id": 1}, {"id": 2}, {"id": 3}], "index_of", "id == 2", 1),
-        (
-            [{"status": "active"}, {"status": "inactive"}, {"status": "active"}],
-            "random_except",
-            "status == 'inactive'",
-            {"status": "active"},
-        ),
-    ],
+    _SELECT_FROM_LIST_NEW_OPTIONS_CASES,
+    ids=[f"case{i}" for i in range(len(_SELECT_FROM_LIST_NEW_OPTIONS_CASES))],
 )
 async def test_select_from_list_new_options(client, items, operation, param, expected):
     params = {"items": items, "operation": operation}
@@ -841,111 +785,150 @@ async def test_select_from_list_new_options(client, items, operation, param, exp
 
 
 # --- Tests for generate tool ---
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "input, operation, param, expected",
-    [
-        (None, "range", [0, 5], [0, 1, 2, 3, 4]),
-        (None, "range", [1, 10, 3], [1, 4, 7]),
-        (None, "range", [5, 5], []),
-        (None, "range", [5, 1, -1], [5, 4, 3, 2]),
-        (
-            [[1, 2], ["a", "b"]],
-            "cartesian_product",
-            None,
-            [(1, "a"), (1, "b"), (2, "a"), (2, "b")],
-        ),
-        ("x", "repeat", 3, ["x", "x", "x"]),
-        ([1, 2], "powerset", None, [[], [1], [2], [1, 2]]),
-        ([1, 2, 3, 4], "windowed", 2, [(1, 2), (2, 3), (3, 4)]),
-        ([1, 2], "cycle", 5, [1, 2, 1, 2, 1]),
-        ([1, 2, 3], "accumulate", None, [1, 3, 6]),
-        ([1, 2, 3, 4], "accumulate", "mul", [1, 2, 6, 24]),
-        (["a", "b", "c"], "zip_with_index", None, [(0, "a"), (1, "b"), (2, "c")]),
-        ([1, 2, 3], "unique_pairs", None, [(1, 2), (1, 3), (2, 3)]),
-        (
-            [1, 2, 3],
-            "permutations",
-            None,
-            [[1, 2, 3], [1, 3, 2], [2, 1, 3], [2, 3, 1], [3, 1, 2], [3, 2, 1]],
-        ),
-        (
-            [1, 2, 3],
-            "permutations",
-            2,
-            [[1, 2], [1, 3], [2, 1], [2, 3], [3, 1], [3, 2]],
-        ),
-        (
-            [1, 2, 3, 4],
-            "combinations",
-            2,
-            [[1, 2], [1, 3], [1, 4], [2, 3], [2, 4], [3, 4]],
-        ),
-        ([], "powerset", None, [[]]),
-        ([], "permutations", None, [[]]),
-        ([], "combinations", 1, []),
-        ([1, 2, 3], "windowed", 4, []),
-        ([1, 2, 3], "windowed", 1, [(1,), (2,), (3,)]),
-        ([1, 2, 3], "windowed", 0, ValueError),
-        ([1, 2, 3], "cycle", None, ValueError),
-        ([1, 2, 3], "accumulate", "invalid", ValueError),
-        ([1, 2, 3], "combinations", None, ValueError),
-        ([1, 2, 3], "not_a_real_op", None, ValueError),
-    ],
+
+_GENERATE_CASES = (
+    (None, "range", [0, 5], [0, 1, 2, 3, 4]),
+    (None, "range", [1, 10, 3], [1, 4, 7]),
+    (None, "range", [5, 5], []),
+    (None, "range", [5, 1, -1], [5, 4, 3, 2]),
+    (
+        [[1, 2], ["a", "b"]],
+        "cartesian_product",
+        None,
+        [(1, "a"), (1, "b"), (2, "a"), (2, "b")],
+    ),
+    ("x", "repeat", 3, ["x", "x", "x"]),
+    ([1, 2], "powerset", None, [[], [1], [2], [1, 2]]),
+    ([1, 2, 3, 4], "windowed", 2, [(1, 2), (2, 3), (3, 4)]),
+    ([1, 2], "cycle", 5, [1, 2, 1, 2, 1]),
+    ([1, 2, 3], "accumulate", None, [1, 3, 6]),
+    ([1, 2, 3, 4], "accumulate", "mul", [1, 2, 6, 24]),
+    (["a", "b", "c"], "zip_with_index", None, [(0, "a"), (1, "b"), (2, "c")]),
+    ([1, 2, 3], "unique_pairs", None, [(1, 2), (1, 3), (2, 3)]),
+    (
+        [1, 2, 3],
+        "permutations",
+        None,
+        [[1, 2, 3], [1, 3, 2], [2, 1, 3], [2, 3, 1], [3, 1, 2], [3, 2, 1]],
+    ),
+    (
+        [1, 2, 3],
+        "permutations",
+        2,
+        [[1, 2], [1, 3], [2, 1], [2, 3], [3, 1], [3, 2]],
+    ),
+    (
+        [1, 2, 3, 4],
+        "combinations",
+        2,
+        [[1, 2], [1, 3], [1, 4], [2, 3], [2, 4], [3, 4]],
+    ),
+    ([], "powerset", None, [[]]),
+    ([], "permutations", None, [[]]),
+    ([], "combinations", 1, []),
+    ([1, 2, 3], "windowed", 4, []),
+    ([1, 2, 3], "windowed", 1, [(1,), (2,), (3,)]),
+    ([1, 2, 3], "windowed", 0, ValueError),
+    ([1, 2, 3], "cycle", None, ValueError),
+    ([1, 2, 3], "accumulate", "invalid", ValueError),
+    ([1, 2, 3], "combinations", None, ValueError),
+    ([1, 2, 3], "not_a_real_op", None, ValueError),
 )
-async def test_generate(client, input, operation, param, expected):
-    # Map old parameters to new options format
+
+
+def _range_options(input, param):
     options = {}
+    if isinstance(param, list) and len(param) >= 2:
+        options["from"] = param[0]
+        options["to"] = param[1]
+        if len(param) > 2:
+            options["step"] = param[2]
+    return options
 
-    if operation == "range":
-        if isinstance(param, list) and len(param) >= 2:
-            options["from"] = param[0]
-            options["to"] = param[1]
-            if len(param) > 2:
-                options["step"] = param[2]
-    elif operation == "cartesian_product":
-        options["lists"] = input
-    elif operation == "repeat":
-        options["value"] = input
-        options["count"] = param
-    elif operation in ["powerset", "unique_pairs", "zip_with_index"]:
-        options["items"] = input
-    elif operation == "windowed":
-        options["items"] = input
-        options["size"] = param
-    elif operation == "cycle":
-        options["items"] = input
-        options["count"] = param
-    elif operation == "accumulate":
-        options["items"] = input
-        if param is not None:
-            options["func"] = param
-    elif operation == "permutations":
-        options["items"] = input
-        if param is not None:
-            options["length"] = param
-    elif operation == "combinations":
-        options["items"] = input
+
+def _accumulate_options(input, param):
+    options = {"items": input}
+    if param is not None:
+        options["func"] = param
+    return options
+
+
+def _permutations_options(input, param):
+    options = {"items": input}
+    if param is not None:
         options["length"] = param
+    return options
+
+
+# Maps each operation's old (input, param) test shape to the generate tool's
+# options dict; built once so the per-case work is a single dict lookup.
+_OP_TO_OPTIONS = {
+    "range": _range_options,
+    "cartesian_product": lambda input, param: {"lists": input},
+    "repeat": lambda input, param: {"value": input, "count": param},
+    "powerset": lambda input, param: {"items": input},
+    "unique_pairs": lambda input, param: {"items": input},
+    "zip_with_index": lambda input, param: {"items": input},
+    "windowed": lambda input, param: {"items": input, "size": param},
+    "cycle": lambda input, param: {"items": input, "count": param},
+    "accumulate": _accumulate_options,
+    "permutations": _permutations_options,
+    "combinations": lambda input, param: {"items": input, "length": param},
+}
+
+
+def _generate_options(input, operation, param):
+    # Map old parameters to new options format
+    build = _OP_TO_OPTIONS.get(operation)
+    return build(input, param) if build is not None else {}
 
-    params = {"options": options, "operation": operation}
-    value, error = await make_tool_call(client, "generate", params)
-    if expected is ValueError:
-        assert error is not None
-    else:
 
-        def normalize(x):
-            if isinstance(x, tuple):
-                return list(x)
-            if isinstance(x, list):
-                return [normalize(i) for i in x]
-            return x
+# Bound once; saves the loads() attribute lookup plus a fresh JSONDecoder per
+# call in the normalization hot path.
+_json_loads = json.JSONDecoder().decode
+_json_dumps = json.JSONEncoder().encode
+
+
+def _normalize(x):
+    # One C-level JSON round-trip canonicalizes tuples to lists at any depth,
+    # without per-element Python recursion.
+    return _json_loads(_json_dumps(x))
+
 
-        assert normalize(value) == normalize(expected)
+# Expected sides normalized once at import; only the live response needs a
+# round-trip per run. ValueError rows mark cases that must report an error.
+_GENERATE_EXPECTED = tuple(
+    expected if expected is ValueError else _normalize(expected)
+    for _, _, _, expected in _GENERATE_CASES
+)
+
+
+async def test_generate(client):
+    # Fire every case through the client in one gather so the per-call
+    # awaits overlap instead of paying a round-trip each.
+    results = await asyncio.gather(
+        *(
+            make_tool_call(
+                client,
+                "generate",
+                {
+                    "options": _generate_options(input, operation, param),
+                    "operation": operation,
+                },
+            )
+            for input, operation, param, _ in _GENERATE_CASES
+        )
+    )
+    for (input, operation, param, _), expected, (value, error) in zip(
+        _GENERATE_CASES, _GENERATE_EXPECTED, results
+    ):
+        if expected is ValueError:
+            assert error is not None, f"{operation} {param!r}: expected an error"
+        else:
+            assert _normalize(value) == expected, f"{operation} {param!r}"
 
 
 # --- Direct function call tests for generate ---
-@pytest.mark.asyncio
 async def test_generate_powerset_direct(client):
     value, error = await make_tool_call(
         client, "generate", {"options": {"items": []}, "operation": "powerset"}
@@ -954,7 +937,6 @@ async def test_generate_powerset_direct(client):
     assert value == [[]]
 
 
-@pytest.mark.asyncio
 async def test_generate_permutations_direct(client):
     value, error = await make_tool_call(
         client, "generate", {"options": {"items": []}, "operation": "permutations"}
@@ -963,117 +945,151 @@ async def test_generate_permutations_direct(client):
     assert value == [[]]
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "input, param, expected",
-    [
-        ("foo", 2, ["foo", "foo"]),
-        (42, 2, [42, 42]),
-        (3.14, 2, [3.14, 3.14]),
-        (True, 2, [True, True]),
-        ([1, 2], 2, [[1, 2], [1, 2]]),
-        ({"a": 1}, 2, [{"a": 1}, {"a": 1}]),
-        (None, 2, [None, None]),
-    ],
+_REPEAT_CASES = (
+    ("foo", 2, ["foo", "foo"]),
+    (42, 2, [42, 42]),
+    (3.14, 2, [3.14, 3.14]),
+    (True, 2, [True, True]),
+    ([1, 2], 2, [[1, 2], [1, 2]]),
+    ({"a": 1}, 2, [{"a": 1}, {"a": 1}]),
+    (None, 2, [None, None]),
 )
-async def test_generate_repeat_all_types(client, input, param, expected):
-    value, error = await make_tool_call(
-        client,
-        "generate",
-        {"options": {"value": input, "count": param}, "operation": "repeat"},
-    )
-    assert value == expected
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "obj, path, value, expected",
-    [
-        ({}, "x", "foo", {"x": "foo"}),
-        ({}, "x", 42, {"x": 42}),
-        ({}, "x", 3.14, {"x": 3.14}),
-        ({}, "x", True, {"x": True}),
-        ({}, "x", [1, 2], {"x": [1, 2]}),
-        ({}, "x", {"a": 1}, {"x": {"a": 1}}),
-        ({}, "x", None, {"x": None}),
-    ],
-)
-async def test_set_value_all_types(client, obj, path, value, expected):
-    value_out, error = await make_tool_call(
-        client,
-        "dicts",
-        {"obj": obj, "operation": "set_value", "path": path, "value": value},
+async def test_generate_repeat_all_types(client):
+    results = await asyncio.gather(
+        *(
+            make_tool_call(
+                client,
+                "generate",
+                {"options": {"value": input, "count": param}, "operation": "repeat"},
+            )
+            for input, param, _ in _REPEAT_CASES
+        )
     )
-    assert value_out == expected
+    for (input, param, expected), (value, error) in zip(_REPEAT_CASES, results):
+        assert value == expected, f"repeat({input!r}, {param})"
+
+
+_SET_VALUE_CASES = (
+    ({}, "x", "foo", {"x": "foo"}),
+    ({}, "x", 42, {"x": 42}),
+    ({}, "x", 3.14, {"x": 3.14}),
+    ({}, "x", True, {"x": True}),
+    ({}, "x", [1, 2], {"x": [1, 2]}),
+    ({}, "x", {"a": 1}, {"x": {"a": 1}}),
+    ({}, "x", None, {"x": None}),
+)
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "obj, path, default, expected",
-    [
-        ({"x": "foo"}, "x", None, "foo"),
-        ({"x": 42}, "x", None, 42),
-        ({"x": 3.14}, "x", None, 3.14),
-        ({"x": True}, "x", None, True),
-        ({"x": [1, 2]}, "x", None, [1, 2]),
-        ({"x": {"a": 1}}, "x", None, {"a": 1}),
-        ({}, "x", None, None),
-        ({}, "x", "foo", "foo"),
-        ({}, "x", 42, 42),
-        ({}, "x", 3.14, 3.14),
-        ({}, "x", True, True),
-        ({}, "x", [1, 2], [1, 2]),
-        ({}, "x", {"a": 1}, {"a": 1}),
-        ({}, "x", None, None),
-    ],
+async def test_set_value_all_types(client):
+    results = await asyncio.gather(
+        *(
+            make_tool_call(
+                client,
+                "dicts",
+                {"obj": obj, "operation": "set_value", "path": path, "value": value},
+            )
+            for obj, path, value, _ in _SET_VALUE_CASES
+        )
+    )
+    for (obj, path, value, expected), (value_out, error) in zip(
+        _SET_VALUE_CASES, results
+    ):
+        assert value_out == expected, f"set_value({path!r}, {value!r})"
+
+
+_GET_VALUE_CASES = (
+    ({"x": "foo"}, "x", None, "foo"),
+    ({"x": 42}, "x", None, 42),
+    ({"x": 3.14}, "x", None, 3.14),
+    ({"x": True}, "x", None, True),
+    ({"x": [1, 2]}, "x", None, [1, 2]),
+    ({"x": {"a": 1}}, "x", None, {"a": 1}),
+    ({}, "x", None, None),
+    ({}, "x", "foo", "foo"),
+    ({}, "x", 42, 42),
+    ({}, "x", 3.14, 3.14),
+    ({}, "x", True, True),
+    ({}, "x", [1, 2], [1, 2]),
+    ({}, "x", {"a": 1}, {"a": 1}),
+    ({}, "x", None, None),
 )
-async def test_get_value_all_types(client, obj, path, default, expected):
-    args = {"obj": obj, "operation": "get_value", "path": path}
-    if default is not None or (default is None and "x" not in obj):
-        args["default"] = default
-    value, error = await make_tool_call(client, "dicts", args)
-    assert value == expected
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "input, tool_calls, expected",
-    [
-        ("foo", [{"tool": "strings", "params": {"operation": "reverse"}}], "oof"),
-        (
-            42,
-            [{"tool": "generate", "params": {"operation": "repeat", "count": 2}}],
-            [42, 42],
-        ),
-        (
-            3.14,
-            [{"tool": "generate", "params": {"operation": "repeat", "count": 2}}],
-            [3.14, 3.14],
-        ),
-        (
-            True,
-            [{"tool": "generate", "params": {"operation": "repeat", "count": 2}}],
-            [True, True],
-        ),
-        (
-            [1, 2],
-            [{"tool": "generate", "params": {"operation": "repeat", "count": 2}}],
-            [[1, 2], [1, 2]],
-        ),
-        (
-            {"a": 1},
-            [{"tool": "generate", "params": {"operation": "repeat", "count": 2}}],
-            [{"a": 1}, {"a": 1}],
-        ),
-        (
-            None,
-            [{"tool": "generate", "params": {"operation": "repeat", "count": 2}}],
-            [None, None],
-        ),
-    ],
+async def test_get_value_all_types(client):
+    calls = []
+    for obj, path, default, _ in _GET_VALUE_CASES:
+        args = {"obj": obj, "operation": "get_value", "path": path}
+        if default is not None or (default is None and "x" not in obj):
+            args["default"] = default
+        calls.append(make_tool_call(client, "dicts", args))
+    results = await asyncio.gather(*calls)
+    for (obj, path, default, expected), (value, error) in zip(
+        _GET_VALUE_CASES, results
+    ):
+        assert value == expected, f"get_value({obj!r}, {path!r}, {default!r})"
+
+
+_CHAIN_CASES = (
+    ("foo", [{"tool": "strings", "params": {"operation": "reverse"}}], "oof"),
+    (
+        42,
+        [{"tool": "generate", "params": {"operation": "repeat", "count": 2}}],
+        [42, 42],
+    ),
+    (
+        3.14,
+        [{"tool": "generate", "params": {"operation": "repeat", "count": 2}}],
+        [3.14, 3.14],
+    ),
+    (
+        True,
+        [{"tool": "generate", "params": {"operation": "repeat", "count": 2}}],
+        [True, True],
+    ),
+    (
+        [1, 2],
+        [{"tool": "generate", "params": {"operation": "repeat", "count": 2}}],
+        [[1, 2], [1, 2]],
+    ),
+    (
+        {"a": 1},
+        [{"tool": "generate", "params": {"operation": "repeat", "count": 2}}],
+        [{"a": 1}, {"a": 1}],
+    ),
+    (
+        None,
+        [{"tool": "generate", "params": {"operation": "repeat", "count": 2}}],
+        [None, None],
+    ),
 )
-async def test_chain_all_types(client, input, tool_calls, expected):
+
+
+async def test_chain_all_types(client):
+    results = await asyncio.gather(
+        *(
+            make_tool_call(client, "chain", {"input": input, "tool_calls": tool_calls})
+            for input, tool_calls, _ in _CHAIN_CASES
+        )
+    )
+    for (input, tool_calls, expected), (value, error) in zip(_CHAIN_CASES, results):
+        assert value == expected, f"chain({input!r})"
+
+
+async def test_chain_pipeline_single_roundtrip(client):
+    """Several string mutations execute in one chain round-trip."""
     value, error = await make_tool_call(
-        client, "chain", {"input": input, "tool_calls": tool_calls}
+        client,
+        "chain",
+        {
+            "input": "  Foo Bar  ",
+            "tool_calls": [
+                {"tool": "strings", "params": {"operation": "trim"}},
+                {"tool": "strings", "params": {"operation": "snake_case"}},
+                {"tool": "strings", "params": {"operation": "upper_case"}},
+            ],
+        },
     )
-    assert value == expected
+    assert error is None
+    assert value == "FOO_BAR"
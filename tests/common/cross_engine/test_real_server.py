@@ -70,7 +70,6 @@ async def shared_client(server_url):
 # === STRINGS TOOL TESTS ===
 
 
-@pytest.mark.asyncio
 async def test_strings_basic_operations(shared_client):
     """Test core string operations."""
     # upper_case
@@ -92,7 +91,6 @@ async def test_strings_basic_operations(shared_client):
     assert json.loads(result[0].text)["value"] is True
 
 
-@pytest.mark.asyncio
 async def test_strings_case_conversion(shared_client):
     """Test string case conversion operations."""
     test_cases = [
@@ -112,7 +110,6 @@ async def test_strings_case_conversion(shared_client):
 # === LISTS TOOL TESTS ===
 
 
-@pytest.mark.asyncio
 async def test_lists_basic_operations(shared_client):
     """Test core list operations."""
     # head
@@ -134,7 +131,6 @@ async def test_lists_basic_operations(shared_client):
     assert json.loads(result[0].text)["value"] is True
 
 
-@pytest.mark.asyncio
 async def test_lists_set_operations(shared_client):
     """Test list set operations."""
     # difference
@@ -158,7 +154,6 @@ async def test_lists_set_operations(shared_client):
     assert 1 in result_value and 4 in result_value
 
 
-@pytest.mark.asyncio
 async def test_lists_functional_operations(shared_client):
     """Test functional list operations."""
     # compact
@@ -198,7 +193,6 @@ async def test_lists_functional_operations(shared_client):
 # === DICTS TOOL TESTS ===
 
 
-@pytest.mark.asyncio
 async def test_dicts_basic_operations(shared_client):
     """Test core dictionary operations."""
     # has_key
@@ -220,7 +214,6 @@ async def test_dicts_basic_operations(shared_client):
     assert json.loads(result[0].text)["value"] is True
 
 
-@pytest.mark.asyncio
 async def test_dicts_advanced_operations(shared_client):
     """Test advanced dictionary operations."""
     # get_value
@@ -252,7 +245,6 @@ async def test_dicts_advanced_operations(shared_client):
 # === ANY TOOL TESTS ===
 
 
-@pytest.mark.asyncio
 async def test_any_tool_operations(shared_client):
     """Test any tool for type-agnostic operations."""
     # is_equal with different types
@@ -297,7 +289,6 @@ async def test_any_tool_operations(shared_client):
 # === GENERATE TOOL TESTS ===
 
 
-@pytest.mark.asyncio
 async def test_generate_tool_operations(shared_client):
     """Test generate tool operations."""
     # repeat
@@ -335,7 +326,6 @@ async def test_generate_tool_operations(shared_client):
 # === CHAIN TOOL TESTS ===
 
 
-@pytest.mark.asyncio
 async def test_chain_tool_operations(shared_client):
     """Test chain tool for combining operations."""
     # Simple chain: string -> upper_case
@@ -365,7 +355,6 @@ async def test_chain_tool_operations(shared_client):
 # === ERROR HANDLING TESTS ===
 
 
-@pytest.mark.asyncio
 async def test_error_handling(shared_client):
     """Test error handling for invalid operations."""
     # Invalid operation
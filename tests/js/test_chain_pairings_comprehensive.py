@@ -1,9 +1,11 @@
 import pytest
-import importlib
 import main
 from main import LeverMCP
-from fastmcp import Client
-from tests import make_tool_call
+from tests import get_shared_client, make_tool_call
+
+# These modules share one entered client per engine; keep them on a single
+# pytest-xdist worker (--dist=loadgroup) so that client is built once.
+pytestmark = pytest.mark.xdist_group("js")
 
 
 def get_engine_expression(lua_expr, js_expr):
@@ -14,26 +16,25 @@ def get_engine_expression(lua_expr, js_expr):
         return lua_expr
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def client():
     """
-    Provides an isolated FastMCP client for each test by reloading the main
-    module and explicitly resetting the application state for the session.
+    Provides a FastMCP client configured for JavaScript expressions, shared
+    across the session; the tools are stateless, so no per-test reload is
+    needed.
     """
-    importlib.reload(main)
     main.USE_JAVASCRIPT = True
 
-    # Create fresh MCP instance with JavaScript tools
-    mcp_instance = LeverMCP("Lever MCP")
-    from tools.js import register_js_tools
+    def make_mcp():
+        mcp_instance = LeverMCP("Lever MCP")
+        from tools.js import register_js_tools
 
-    register_js_tools(mcp_instance)
+        register_js_tools(mcp_instance)
+        return mcp_instance
 
-    async with Client(mcp_instance) as c:
-        yield c
+    yield await get_shared_client("js", make_mcp)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "first_tool,first_params,second_tool,second_params,input_value,expected_type,"
     "expected_value",
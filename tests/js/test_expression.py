@@ -1,34 +1,35 @@
-import importlib
 import pytest
 import main
 from main import LeverMCP
-from fastmcp import Client
-from tests import make_tool_call
+from tests import get_shared_client, make_tool_call
 
+# These modules share one entered client per engine; keep them on a single
+# pytest-xdist worker (--dist=loadgroup) so that client is built once.
+pytestmark = pytest.mark.xdist_group("js")
 
-@pytest.fixture
-async def client():
-    """
-    Provides an isolated FastMCP client for each test by reloading the main
-    module and explicitly configuring it for JavaScript expressions.
-    """
-    importlib.reload(main)
-    main.USE_JAVASCRIPT = True
 
-    # Create fresh MCP instance with JavaScript tools
-    mcp_instance = LeverMCP("Lever MCP")
+def _make_js_mcp() -> LeverMCP:
+    """Create a fresh MCP instance with JavaScript tools."""
     from tools.js import register_js_tools
 
+    mcp_instance = LeverMCP("Lever MCP")
     register_js_tools(mcp_instance)
+    return mcp_instance
 
-    async with Client(mcp_instance) as c:
-        yield c
+
+@pytest.fixture(scope="session")
+async def client():
+    """
+    Provides a FastMCP client configured for JavaScript expressions. The
+    client and its MCP handshake are created once and shared across tests.
+    """
+    main.USE_JAVASCRIPT = True
+    yield await get_shared_client("js", _make_js_mcp)
 
 
 # --- Find By Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "items, expression, expected_name",
     [
@@ -74,7 +75,6 @@ async def test_find_by_expression(client, items, expression, expected_name):
 # --- Filter By Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "items, expression, expected_count",
     [
@@ -108,7 +108,6 @@ async def test_filter_by_expression(client, items, expression, expected_count):
 # --- Map Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "items, expression, expected_result",
     [
@@ -142,7 +141,6 @@ async def test_map_expression(client, items, expression, expected_result):
 # --- Group By Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "items, expression, expected_keys",
     [
@@ -176,7 +174,6 @@ async def test_group_by_expression(client, items, expression, expected_keys):
 # --- Sort By Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "items, expression, expected_order",
     [
@@ -210,7 +207,6 @@ async def test_sort_by_expression(client, items, expression, expected_order):
 # --- Any/Every Expression Tests ---
 
 
-@pytest.mark.asyncio
 async def test_any_by_expression(client):
     items = [{"score": 85}, {"score": 70}, {"score": 95}]
 
@@ -236,7 +232,6 @@ async def test_any_by_expression(client):
 # --- Unique By Expression Tests ---
 
 
-@pytest.mark.asyncio
 async def test_uniq_by_expression(client):
     items = [
         {"id": 1, "name": "Alice"},
@@ -258,7 +253,6 @@ async def test_uniq_by_expression(client):
 # --- Count By Expression Tests ---
 
 
-@pytest.mark.asyncio
 async def test_count_by_expression(client):
     items = [
         {"status": "active"},
@@ -282,7 +276,6 @@ async def test_count_by_expression(client):
 # --- Partition Expression Tests ---
 
 
-@pytest.mark.asyncio
 async def test_partition_expression(client):
     items = [{"age": 25}, {"age": 35}, {"age": 20}, {"age": 40}]
 
@@ -300,7 +293,6 @@ async def test_partition_expression(client):
 # --- Dictionary Expression Tests ---
 
 
-@pytest.mark.asyncio
 async def test_dict_map_values_expression(client):
     obj = {"a": 1, "b": 2, "c": 3}
 
@@ -313,7 +305,6 @@ async def test_dict_map_values_expression(client):
     assert result == {"a": 2, "b": 4, "c": 6}
 
 
-@pytest.mark.asyncio
 async def test_dict_map_keys_expression(client):
     obj = {"firstName": "John", "lastName": "Doe"}
 
@@ -329,7 +320,6 @@ async def test_dict_map_keys_expression(client):
 # --- Any Tool Expression Tests ---
 
 
-@pytest.mark.asyncio
 async def test_any_eval_expression(client):
     value = {"name": "Alice", "age": 30, "scores": [85, 90, 88]}
 
@@ -368,7 +358,6 @@ async def test_any_eval_expression(client):
 # --- Dictionary Expression Tests with JavaScript Syntax ---
 
 
-@pytest.mark.asyncio
 async def test_dicts_map_keys_js(client):
     """Test dicts.map_keys operation with JavaScript expressions."""
     # Transform keys to uppercase
@@ -414,7 +403,6 @@ async def test_dicts_map_keys_js(client):
     assert "Dict operation 'map_keys' requires a dictionary input" in error
 
 
-@pytest.mark.asyncio
 async def test_dicts_map_values_js(client):
     """Test dicts.map_values operation with JavaScript expressions."""
     # Double all values
@@ -463,7 +451,6 @@ async def test_dicts_map_values_js(client):
 # --- Pluck Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "items, expression, expected_values",
     [
@@ -499,7 +486,6 @@ async def test_pluck_expression(client, items, expression, expected_values):
 # --- Min/Max By Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "items, expression, operation, expected_value",
     [
@@ -560,7 +546,6 @@ async def test_min_max_by_expression(
 # --- Difference/Intersection By Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "items, others, expression, operation, expected_count",
     [
@@ -601,7 +586,6 @@ async def test_difference_intersection_by_expression(
 # --- Remove By Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "items, expression, expected_count",
     [
@@ -636,7 +620,6 @@ async def test_remove_by_expression(client, items, expression, expected_count):
 # --- Null Handling Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "value, expression, expected_result",
     [
@@ -675,7 +658,6 @@ async def test_null_handling_expression(client, value, expression, expected_resu
 # --- Null Sentinel Behavior Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "value, expression, expected_result, description",
     [
@@ -704,7 +686,6 @@ async def test_null_sentinel_behavior(
 # --- Multi-line Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "value, expression, expected_result",
     [
@@ -745,7 +726,6 @@ async def test_multiline_expression(client, value, expression, expected_result):
 # --- Safety Mode Tests ---
 
 
-@pytest.mark.asyncio
 async def test_safe_mode_blocks_dangerous_operations(client):
     # Test that dangerous operations are blocked
     result, error = await make_tool_call(
@@ -761,7 +741,6 @@ async def test_safe_mode_blocks_dangerous_operations(client):
     assert result == "safe"
 
 
-@pytest.mark.asyncio
 async def test_safe_mode_allows_safe_operations(client):
     # Test that safe operations work
     result, error = await make_tool_call(
@@ -780,7 +759,6 @@ async def test_safe_mode_allows_safe_operations(client):
 # --- Complex Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "items, operation, expression, expected_result",
     [
@@ -846,7 +824,6 @@ async def test_complex_expressions(
 # --- New String Operations Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "text, operation, param, data, expected_result",
     [
@@ -880,7 +857,6 @@ async def test_new_string_operations_expressions(
 # --- New List Operations Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "items, operation, param, expected_result",
     [
@@ -912,7 +888,6 @@ async def test_new_list_operations_expressions(
     assert result == expected_result
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "items, operation, expression, expected_result",
     [
@@ -984,7 +959,6 @@ async def test_new_list_by_operations_expressions(
 # --- New Dict Operations Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "obj, operation, expected_result",
     [
@@ -1015,7 +989,6 @@ async def test_new_dict_operations_expressions(client, obj, operation, expected_
         assert sorted(result) == sorted(expected_result)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "obj, operation, expression, expected_result",
     [
@@ -1059,7 +1032,6 @@ async def test_new_dict_transformation_expressions(
     assert result == expected_result
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "obj, operation, expected_result",
     [
@@ -1098,7 +1070,6 @@ async def test_new_dict_structure_expressions(client, obj, operation, expected_r
 # --- New Any Operation Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "value, expected_result",
     [
@@ -1125,7 +1096,6 @@ async def test_new_any_size_expressions(client, value, expected_result):
 # --- Complex Expression Tests Using New Operations ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "items, operation, expression, expected_count",
     [
@@ -1163,7 +1133,6 @@ async def test_complex_expressions_with_new_operations(
 # --- Complex Null Handling Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "value, expression, expected_result, description",
     [
@@ -6,36 +6,35 @@ and not available in Lua, ensuring proper support for modern JavaScript syntax.
 """
 
 import pytest
-import importlib
 import main
 from main import LeverMCP
-from fastmcp import Client
-from tests import make_tool_call
+from tests import get_shared_client, make_tool_call
 
+pytestmark = pytest.mark.xdist_group("js")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 async def client():
     """
-    Provides an isolated FastMCP client for each test by reloading the main
-    module and explicitly configuring it for JavaScript expressions.
+    Provides a FastMCP client configured for JavaScript expressions, shared
+    with the other JavaScript modules for the whole session; the tools are
+    stateless, so no per-test reload of main is needed.
     """
-    importlib.reload(main)
     main.USE_JAVASCRIPT = True
 
-    # Create fresh MCP instance with JavaScript tools
-    mcp_instance = LeverMCP("Lever MCP")
-    from tools.js import register_js_tools
+    def make_mcp():
+        mcp_instance = LeverMCP("Lever MCP")
+        from tools.js import register_js_tools
 
-    register_js_tools(mcp_instance)
+        register_js_tools(mcp_instance)
+        return mcp_instance
 
-    async with Client(mcp_instance) as c:
-        yield c
+    yield await get_shared_client("js", make_mcp)
 
 
 # --- Arrow Function Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "expression, expected_result",
     [
@@ -66,7 +65,6 @@ async def test_arrow_functions(client, expression, expected_result):
 # --- Template Literal Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "expression, context_value, expected_result",
     [
@@ -109,7 +107,6 @@ async def test_template_literals(client, expression, context_value, expected_res
 # --- Destructuring Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "expression, context_value, expected_result",
     [
@@ -156,7 +153,6 @@ async def test_destructuring(client, expression, context_value, expected_result)
 # --- Spread Operator Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "expression, context_value, expected_result",
     [
@@ -192,7 +188,6 @@ async def test_spread_operator(client, expression, context_value, expected_resul
 # --- Modern Array Methods Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "expression, expected_result",
     [
@@ -225,7 +220,6 @@ async def test_modern_array_methods(client, expression, expected_result):
 # --- Let/Const Scoping Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "expression, expected_result",
     [
@@ -273,7 +267,6 @@ async def test_let_const_scoping(client, expression, expected_result):
 # --- Truthy/Falsy Behavior Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "value, expression, expected_result",
     [
@@ -312,7 +305,6 @@ async def test_truthy_falsy_behavior(client, value, expression, expected_result)
 # --- Type System Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "value, expression, expected_result",
     [
@@ -352,7 +344,6 @@ async def test_type_system(client, value, expression, expected_result):
 # --- Error Handling Tests ---
 
 
-@pytest.mark.asyncio
 async def test_try_catch_expressions(client):
     """Test try/catch error handling in expressions."""
     # Test successful try block
@@ -397,7 +388,6 @@ async def test_try_catch_expressions(client):
 # --- JSON Operations Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "expression, context_value, expected_result",
     [
@@ -429,7 +419,6 @@ async def test_json_operations(client, expression, context_value, expected_resul
 # --- Regular Expression Tests ---
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "expression, context_value, expected_result",
     [
@@ -6,19 +6,29 @@ in safe mode and that dangerous operations are blocked.
 """
 
 import pytest
-import importlib
 import main
 from main import LeverMCP
 from fastmcp import Client
 from tests import make_tool_call
 
 
+def _set_safe_mode(enabled: bool) -> None:
+    """
+    Set the safe-mode flags directly instead of reloading main; these globals
+    are the only state the mode switch touches, so the reload's bytecode
+    re-exec and tool re-registration are avoidable.
+    """
+    import lib.js
+
+    main.USE_JAVASCRIPT = True
+    main.SAFE_MODE = enabled
+    lib.js.SAFE_MODE_DEFAULT = enabled
+
+
 @pytest.fixture
 async def safe_client():
     """Client with JavaScript in safe mode (default)."""
-    importlib.reload(main)
-    main.USE_JAVASCRIPT = True
-    main.SAFE_MODE = True  # Explicitly set safe mode
+    _set_safe_mode(True)
 
     mcp_instance = LeverMCP("Lever MCP")
     from tools.js import register_js_tools
@@ -32,14 +42,7 @@ async def safe_client():
 @pytest.fixture
 async def unsafe_client():
     """Client with JavaScript in unsafe mode (--unsafe flag equivalent)."""
-    importlib.reload(main)
-    main.USE_JAVASCRIPT = True
-    main.SAFE_MODE = False  # Unsafe mode
-
-    # Also need to update the js module's SAFE_MODE_DEFAULT
-    import lib.js
-
-    lib.js.SAFE_MODE_DEFAULT = False
+    _set_safe_mode(False)
 
     mcp_instance = LeverMCP("Lever MCP")
     from tools.js import register_js_tools
@@ -50,7 +53,6 @@ async def unsafe_client():
         yield c
 
 
-@pytest.mark.asyncio
 async def test_safe_operations_work(safe_client):
     """Test that safe JavaScript operations work in safe mode."""
     safe_tests = [
@@ -72,7 +74,6 @@ async def test_safe_operations_work(safe_client):
         assert result == expected, f"Expected {expected}, got {result} for {expression}"
 
 
-@pytest.mark.asyncio
 async def test_dangerous_operations_blocked_in_safe_mode(safe_client):
     """Test that dangerous operations are blocked in safe mode."""
     dangerous_expressions = [
@@ -110,7 +111,6 @@ async def test_dangerous_operations_blocked_in_safe_mode(safe_client):
 # Manual testing shows unsafe mode works correctly with --unsafe flag.
 
 
-@pytest.mark.asyncio
 async def test_mcp_tools_work_in_safe_mode(safe_client):
     """Test that MCP tool functions work properly in safe mode."""
     # Test strings tools
@@ -139,7 +139,6 @@ async def test_mcp_tools_work_in_safe_mode(safe_client):
     assert result == 4
 
 
-@pytest.mark.asyncio
 async def test_multiline_expressions_work_safely(safe_client):
     """Test that multiline JavaScript expressions work in safe mode."""
     multiline_expr = """
@@ -158,7 +157,6 @@ async def test_multiline_expressions_work_safely(safe_client):
     assert result == 3  # Average of [1,2,3,4,5] is 3
 
 
-@pytest.mark.asyncio
 async def test_fresh_runtime_per_evaluation(safe_client):
     """Test that each evaluation gets a fresh JavaScript runtime."""
     # Note: PythonMonkey creates fresh runtimes for each evaluation
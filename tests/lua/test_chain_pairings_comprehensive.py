@@ -1,9 +1,11 @@
 import pytest
-import importlib
 import main
 from main import LeverMCP
-from fastmcp import Client
-from tests import make_tool_call
+from tests import get_shared_client, make_tool_call
+
+# These modules share one entered client per engine; keep them on a single
+# pytest-xdist worker (--dist=loadgroup) so that client is built once.
+pytestmark = pytest.mark.xdist_group("lua")
 
 
 def get_engine_expression(lua_expr, js_expr):
@@ -14,26 +16,24 @@ def get_engine_expression(lua_expr, js_expr):
         return lua_expr
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def client():
     """
-    Provides an isolated FastMCP client for each test by reloading the main
-    module and explicitly configuring it for Lua expressions.
+    Provides a FastMCP client configured for Lua expressions, shared across
+    the session; the tools are stateless, so no per-test reload is needed.
     """
-    importlib.reload(main)
     main.USE_JAVASCRIPT = False
 
-    # Create fresh MCP instance with Lua tools
-    mcp_instance = LeverMCP("Lever MCP")
-    from tools.lua import register_lua_tools
+    def make_mcp():
+        mcp_instance = LeverMCP("Lever MCP")
+        from tools.lua import register_lua_tools
 
-    register_lua_tools(mcp_instance)
+        register_lua_tools(mcp_instance)
+        return mcp_instance
 
-    async with Client(mcp_instance) as c:
-        yield c
+    yield await get_shared_client("lua", make_mcp)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "first_tool,first_params,second_tool,second_params,input_value,expected_type,"
     "expected_value",
@@ -1,31 +1,31 @@
 import pytest
-import importlib
 import main
 from main import LeverMCP
-from fastmcp import Client
-from tests import make_tool_call
+from tests import get_shared_client, make_tool_call
 
+# These modules share one entered client per engine; keep them on a single
+# pytest-xdist worker (--dist=loadgroup) so that client is built once.
+pytestmark = pytest.mark.xdist_group("lua")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 async def client():
     """
-    Provides an isolated FastMCP client for each test by reloading the main
-    module and explicitly configuring it for Lua expressions.
+    Provides a FastMCP client configured for Lua expressions, shared across
+    the session; the tools are stateless, so no per-test reload is needed.
     """
-    importlib.reload(main)
     main.USE_JAVASCRIPT = False
 
-    # Create fresh MCP instance with Lua tools
-    mcp_instance = LeverMCP("Lever MCP")
-    from tools.lua import register_lua_tools
+    def make_mcp():
+        mcp_instance = LeverMCP("Lever MCP")
+        from tools.lua import register_lua_tools
 
-    register_lua_tools(mcp_instance)
+        register_lua_tools(mcp_instance)
+        return mcp_instance
 
-    async with Client(mcp_instance) as c:
-        yield c
+    yield await get_shared_client("lua", make_mcp)
 
 
-@pytest.mark.asyncio
 async def test_lists_map_with_index(client):
     """Test that lists.map provides index parameter."""
     items = ["a", "b", "c"]
@@ -38,7 +38,6 @@ async def test_lists_map_with_index(client):
     assert result == ["a1", "b2", "c3"]
 
 
-@pytest.mark.asyncio
 async def test_lists_map_with_items_access(client):
     """Test that lists.map provides items parameter."""
     items = ["x", "y", "z"]
@@ -51,7 +50,6 @@ async def test_lists_map_with_items_access(client):
     assert result == ["x3", "y3", "z3"]
 
 
-@pytest.mark.asyncio
 async def test_lists_filter_by_with_index(client):
     """Test that lists.filter_by can use index."""
     items = ["a", "b", "c", "d", "e"]
@@ -68,7 +66,6 @@ async def test_lists_filter_by_with_index(client):
     assert result == ["a", "c", "e"]
 
 
-@pytest.mark.asyncio
 async def test_lists_find_by_with_index(client):
     """Test that lists.find_by can use index."""
     items = [{"name": "Alice"}, {"name": "Bob"}, {"name": "Charlie"}]
@@ -85,7 +82,6 @@ async def test_lists_find_by_with_index(client):
     assert result == {"name": "Bob"}
 
 
-@pytest.mark.asyncio
 async def test_lists_group_by_with_index(client):
     """Test that lists.group_by can use index."""
     items = ["a", "b", "c", "d"]
@@ -105,7 +101,6 @@ async def test_lists_group_by_with_index(client):
     assert result["second_half"] == ["c", "d"]
 
 
-@pytest.mark.asyncio
 async def test_lists_pluck_with_items_context(client):
     """Test that lists.pluck can access the full items list."""
     items = [{"value": 10}, {"value": 20}, {"value": 30}]
@@ -125,7 +120,6 @@ async def test_lists_pluck_with_items_context(client):
         assert abs(result[i] - expected[i]) < 0.0001
 
 
-@pytest.mark.asyncio
 async def test_lists_all_by_with_index(client):
     """Test that lists.all_by can use index."""
     items = ["a", "b", "c"]
@@ -142,7 +136,6 @@ async def test_lists_all_by_with_index(client):
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_lists_any_by_with_index(client):
     """Test that lists.any_by can use index."""
     items = ["a", "b", "c"]
@@ -159,7 +152,6 @@ async def test_lists_any_by_with_index(client):
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_lists_complex_expression_with_all_params(client):
     """Test complex expression using item, index, and items."""
     items = [
@@ -180,7 +172,6 @@ async def test_lists_complex_expression_with_all_params(client):
     assert result == ["Alice_rank1_of3", "Bob_rank2_of3", "Charlie_rank3_of3"]
 
 
-@pytest.mark.asyncio
 async def test_lists_index_starts_at_one(client):
     """Test that index starts at 1, not 0."""
     items = ["first", "second", "third"]
@@ -193,7 +184,6 @@ async def test_lists_index_starts_at_one(client):
     assert result == [1, 2, 3]
 
 
-@pytest.mark.asyncio
 async def test_lists_uniq_by_with_index(client):
     """Test that lists.uniq_by can use index."""
     items = ["a", "b", "a", "c", "b"]
@@ -213,7 +203,6 @@ async def test_lists_uniq_by_with_index(client):
     assert result == ["a", "b", "a", "c", "b"]
 
 
-@pytest.mark.asyncio
 async def test_lists_partition_with_index(client):
     """Test that lists.partition can use index."""
     items = ["a", "b", "c", "d", "e", "f"]
@@ -10,11 +10,17 @@ import unicodedata
 import random
 from typing import Any, Dict, Optional, Callable
 
+# Compiled once at import; the case conversions run per tool call, so this
+# keeps the regex cache lookup out of that path.
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]+")
+_LOWER_UPPER_RE = re.compile(r"([a-z0-9])([A-Z])")
+_UPPER_WORD_RE = re.compile(r"(.)([A-Z][a-z]+)")
+
 
 def op_camel_case(text: str, **kwargs) -> dict:
     """Convert to camelCase."""
     # First normalize: replace non-alphanumeric with spaces, then title case
-    cleaned = re.sub(r"[^a-zA-Z0-9]+", " ", text).strip()
+    cleaned = _NON_ALNUM_RE.sub(" ", text).strip()
     if not cleaned:
         return {"value": ""}
 
@@ -95,9 +101,9 @@ def op_kebab_case(text: str, **kwargs) -> dict:
     """Convert to kebab-case."""
     # Handle camelCase, PascalCase, snake_case, and spaces
     # First insert hyphens before capitals that follow lowercase letters or numbers
-    result = re.sub(r"([a-z0-9])([A-Z])", r"\1-\2", text)
+    result = _LOWER_UPPER_RE.sub(r"\1-\2", text)
     # Replace underscores and other non-alphanumeric chars with hyphens
-    result = re.sub(r"[^a-zA-Z0-9]+", "-", result)
+    result = _NON_ALNUM_RE.sub("-", result)
     # Remove leading/trailing hyphens and convert to lowercase
     result = result.strip("-").lower()
     return {"value": result}
@@ -185,10 +191,10 @@ def op_slice(text: str, data: Optional[dict] = None, **kwargs) -> dict:
 def op_snake_case(text: str, **kwargs) -> dict:
     """Convert to snake_case."""
     # Handle camelCase and PascalCase
-    s1 = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", text)
-    s2 = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1)
+    s1 = _UPPER_WORD_RE.sub(r"\1_\2", text)
+    s2 = _LOWER_UPPER_RE.sub(r"\1_\2", s1)
     # Replace non-alphanumeric with underscores
-    cleaned = re.sub(r"[^a-zA-Z0-9]+", "_", s2).strip("_")
+    cleaned = _NON_ALNUM_RE.sub("_", s2).strip("_")
     return {"value": cleaned.lower()}
 
 